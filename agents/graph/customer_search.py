@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import heapq
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+
+from .customer_source import fetch_customers, load_customers_csv
+
+if TYPE_CHECKING:
+    from .neo4j_client import Neo4jClient
+
+
+def _normalize(text: str) -> str:
+    return " ".join(str(text).lower().split())
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class CustomerSearchIndex:
+    """In-memory typeahead index over customer id and name.
+
+    Two structures back `search`:
+      - a sorted `(token, row)` list for prefix matches on the id, the full
+        name and each name word (binary search, then walk the page);
+      - a trigram inverted index for substring matches such as "0007" or
+        "avis", verified against the normalized text.
+
+    Adds go to a small sorted delta list that is merged into the main list
+    once it grows past `merge_threshold`, so inserts stay cheap. The merge is
+    a linear `heapq.merge` built outside the lock and swapped in, so queries
+    keep running while it happens. Renamed or removed customers leave stale
+    entries behind; they are filtered at query time and compacted away by a
+    merge once enough of them pile up. `refresh` / `refresh_if_stale` re-read
+    the source and apply only the difference, so customers created after
+    start-up become searchable.
+    """
+
+    def __init__(
+        self,
+        customers: Iterable[dict] = (),
+        merge_threshold: int = 4096,
+        loader: Callable[[], Iterable[dict]] | None = None,
+    ):
+        self._lock = threading.RLock()
+        self._merge_threshold = merge_threshold
+        # Re-reads the full customer list for `refresh` (set by from_graph/from_csv).
+        self._loader = loader
+        self._refreshed_at = time.monotonic()
+        self._refreshing = threading.Lock()
+
+        self._ids: list[str] = []
+        self._names: list[str | None] = []  # None marks a removed customer
+        self._text: list[str] = []  # normalized "id name"
+        self._row_of: dict[str, int] = {}
+        self._live = 0
+        self._stale: set[int] = set()  # renamed/removed since the last merge
+
+        self._prefix: list[tuple[str, int]] = []
+        self._delta: list[tuple[str, int]] = []
+        # Delta and stale rows handed to an in-progress merge; still searched.
+        self._merging: list[tuple[str, int]] = []
+        self._merging_stale: set[int] = set()
+        self._merge_running = False
+        self._grams: dict[str, array] = {}
+
+        self.add(customers)
+
+    @classmethod
+    def from_graph(cls, client: Neo4jClient | None = None) -> "CustomerSearchIndex":
+        loader = lambda: fetch_customers(client)
+        return cls(loader(), loader=loader)
+
+    @classmethod
+    def from_csv(cls, data_dir: str | Path | None = None) -> "CustomerSearchIndex":
+        loader = lambda: load_customers_csv(data_dir)
+        return cls(loader(), loader=loader)
+
+    def __len__(self) -> int:
+        return self._live
+
+    # --------------------------------------------------------------------- #
+    # Updates
+    # --------------------------------------------------------------------- #
+
+    @staticmethod
+    def _tokens(customer_id: str, name: str) -> set[str]:
+        name = _normalize(name)
+        tokens = {customer_id.lower(), *name.split()}
+        if name:
+            tokens.add(name)
+        return tokens
+
+    def add(self, customers: Iterable[dict]) -> None:
+        """Insert or update customers given as `{customer_id, name}` dicts."""
+        with self._lock:
+            entries: list[tuple[str, int]] = []
+            for customer in customers:
+                customer_id = str(customer["customer_id"])
+                name = customer.get("name") or ""
+                row = self._row_of.get(customer_id)
+                if row is None:
+                    row = len(self._ids)
+                    self._row_of[customer_id] = row
+                    self._ids.append(customer_id)
+                    self._names.append(name)
+                    self._text.append("")
+                    self._live += 1
+                elif self._names[row] == name:
+                    continue
+                else:
+                    if self._names[row] is None:
+                        self._live += 1
+                    self._names[row] = name
+                    self._stale.add(row)
+
+                text = _normalize(f"{customer_id} {name}")
+                self._text[row] = text
+                entries.extend((token, row) for token in self._tokens(customer_id, name))
+                for gram in _trigrams(text):
+                    postings = self._grams.get(gram)
+                    if postings is None:
+                        postings = self._grams[gram] = array("I")
+                    postings.append(row)
+
+            if not entries:
+                return
+            self._delta = list(heapq.merge(self._delta, sorted(entries)))
+            if len(self._delta) <= self._merge_threshold or self._merge_running:
+                return
+            self._merge_running = True
+            prefix, delta = self._prefix, self._delta
+            self._merging, self._delta = delta, []
+            stale: set[int] = set()
+            # Stale entries are only compacted out once there are enough of
+            # them to be worth a filtering pass over the whole list.
+            if len(self._stale) > self._merge_threshold // 4:
+                stale, self._stale = self._stale, set()
+                self._merging_stale = stale
+        self._merge(prefix, delta, stale)
+
+    def remove(self, customer_id: str) -> bool:
+        with self._lock:
+            row = self._row_of.get(customer_id)
+            if row is None or self._names[row] is None:
+                return False
+            self._names[row] = None
+            self._live -= 1
+            self._stale.add(row)
+            return True
+
+    def sync(self, customers: Iterable[dict]) -> dict:
+        """Make the index match a full customer list: add new, rename, remove missing.
+
+        The diff is computed without the lock; only changed customers go
+        through `add`, so a sync with nothing new costs searches nothing.
+        """
+        changed, seen = [], set()
+        for customer in customers:
+            customer_id = str(customer["customer_id"])
+            seen.add(customer_id)
+            row = self._row_of.get(customer_id)
+            if row is None or self._names[row] != (customer.get("name") or ""):
+                changed.append(customer)
+        gone = [
+            cid for cid, row in list(self._row_of.items())
+            if cid not in seen and self._names[row] is not None
+        ]
+        added = sum(str(c["customer_id"]) not in self._row_of for c in changed)
+        self.add(changed)
+        removed = sum(self.remove(cid) for cid in gone)
+        return {"added": added, "updated": len(changed) - added, "removed": removed}
+
+    def refresh(self) -> dict:
+        """Re-read customers from the index's source and apply the difference."""
+        if self._loader is None:
+            raise RuntimeError("CustomerSearchIndex has no loader to refresh from")
+        with self._refreshing:
+            result = self.sync(self._loader())
+            self._refreshed_at = time.monotonic()
+        return result
+
+    def refresh_if_stale(self, max_age_s: float) -> bool:
+        """Start a background `refresh` if the last one is older than `max_age_s`.
+
+        Returns immediately, so it can be called on every UI rerun; customers
+        created after start-up show up once the refresh lands.
+        """
+        if (
+            self._loader is None
+            or max_age_s <= 0
+            or time.monotonic() - self._refreshed_at < max_age_s
+            or self._refreshing.locked()
+        ):
+            return False
+        self._refreshed_at = time.monotonic()  # one attempt per interval, even if it fails
+
+        def run() -> None:
+            try:
+                self.refresh()
+            except Exception as exc:
+                print(f"[customer-search] refresh failed: {exc}")
+
+        threading.Thread(target=run, name="customer-search-refresh", daemon=True).start()
+        return True
+
+    def _merge(
+        self,
+        prefix: list[tuple[str, int]],
+        delta: list[tuple[str, int]],
+        stale: set[int],
+    ) -> None:
+        """Fold `delta` into `prefix` without holding the lock, then swap it in.
+
+        Rows changed while the merge runs land in the fresh `_stale` set, so
+        entries checked against an older name here are still filtered later.
+        """
+        try:
+            merged = heapq.merge(prefix, delta)
+            if stale:
+                has_token = self._has_token
+                merged = [
+                    (token, row) for token, row in merged
+                    if row not in stale or has_token(token, row)
+                ]
+            else:
+                merged = list(merged)
+            with self._lock:
+                self._prefix = merged
+                self._merging = []
+                self._merging_stale = set()
+        finally:
+            self._merge_running = False
+
+    def _has_token(self, token: str, row: int) -> bool:
+        name = self._names[row]
+        return name is not None and token in self._tokens(self._ids[row], name)
+
+    def _is_current(self, token: str, row: int) -> bool:
+        if row not in self._stale and row not in self._merging_stale:
+            return True
+        return self._has_token(token, row)
+
+    # --------------------------------------------------------------------- #
+    # Queries
+    # --------------------------------------------------------------------- #
+
+    @staticmethod
+    def _range(entries: list[tuple[str, int]], prefix: str) -> Iterator[tuple[str, int]]:
+        i = bisect_left(entries, (prefix, -1))
+        while i < len(entries) and entries[i][0].startswith(prefix):
+            yield entries[i]
+            i += 1
+
+    def _iter_matches(self, query: str) -> Iterator[int]:
+        if not query:
+            yield from (row for row, name in enumerate(self._names) if name is not None)
+            return
+
+        seen: set[int] = set()
+        for token, row in heapq.merge(
+            self._range(self._prefix, query),
+            self._range(self._merging, query),
+            self._range(self._delta, query),
+        ):
+            if row not in seen and self._is_current(token, row):
+                seen.add(row)
+                yield row
+
+        if len(query) < 3:
+            return
+        postings = [self._grams.get(gram) for gram in _trigrams(query)]
+        if any(p is None for p in postings):
+            return
+        names, text = self._names, self._text
+        for row in min(postings, key=len):
+            if query in text[row] and row not in seen and names[row] is not None:
+                seen.add(row)
+                yield row
+
+    def get(self, customer_id: str) -> dict | None:
+        row = self._row_of.get(customer_id)
+        if row is None or self._names[row] is None:
+            return None
+        return {"customer_id": customer_id, "name": self._names[row]}
+
+    def search(self, query: str, limit: int = 25, offset: int = 0) -> dict:
+        """Return one page of customers matching `query` by id or name.
+
+        Prefix matches come first (ordered by matched token), then substring
+        matches. `next_offset` is None on the last page.
+        """
+        query = _normalize(query)
+        with self._lock:
+            rows = list(islice(self._iter_matches(query), offset, offset + limit + 1))
+            items = [
+                {"customer_id": self._ids[row], "name": self._names[row]}
+                for row in rows[:limit]
+            ]
+        return {
+            "items": items,
+            "offset": offset,
+            "next_offset": offset + limit if len(rows) > limit else None,
+        }
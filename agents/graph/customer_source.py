@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .neo4j_client import Neo4jClient
+
+
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+
+# One row per customer with all attached products and events.
+# Shape matches `load_customer_records_csv` so callers can swap sources.
+CUSTOMER_RECORDS_CYPHER = """
+MATCH (c:Customer)
+WHERE $customer_ids IS NULL OR c.customerId IN $customer_ids
+OPTIONAL MATCH (c)-[:HAS_PRODUCT]->(p:Product)
+WITH c, collect(p {.*}) AS products
+OPTIONAL MATCH (c)-[:HAS_EVENT]->(e:Event)
+RETURN c {.*} AS customer, products, collect(e {.*}) AS events
+"""
+
+CUSTOMERS_CYPHER = """
+MATCH (c:Customer)
+RETURN c.customerId AS customer_id, c.name AS name
+"""
+
+
+def fetch_customers(client: Neo4jClient | None = None) -> list[dict]:
+    """Return `{customer_id, name}` for every customer in the graph."""
+    if client is None:
+        from .neo4j_client import Neo4jClient
+
+        client = Neo4jClient()
+    return client.run_query(CUSTOMERS_CYPHER)
+
+
+def fetch_customer_records(
+    client: Neo4jClient | None = None,
+    customer_ids: list[str] | None = None,
+) -> list[dict]:
+    """Return `{customer, products, events}` records from the graph.
+
+    Pass `customer_ids` to restrict the fetch (used for incremental refresh).
+    """
+    if client is None:
+        from .neo4j_client import Neo4jClient
+
+        client = Neo4jClient()
+    return client.run_query(
+        CUSTOMER_RECORDS_CYPHER,
+        {"customer_ids": list(customer_ids) if customer_ids is not None else None},
+    )
+
+
+OPEN_EVENTS_CYPHER = """
+MATCH (c:Customer {customerId: $customer_id})-[:HAS_EVENT]->(e:Event)
+WHERE toLower(e.event_status) = "open"
+RETURN
+  e.EventID AS eventId,
+  e.event_type AS eventType,
+  e.event_message AS eventMessage,
+  e.event_open_date AS eventOpenDate
+"""
+
+
+def fetch_open_events(client: Neo4jClient, customer_id: str | None) -> list[dict]:
+    """Open events for one customer, read straight from the graph."""
+    if customer_id is None:
+        return []
+    return client.run_query(OPEN_EVENTS_CYPHER, {"customer_id": customer_id})
+
+
+def _read_csv(path: Path) -> list[dict]:
+    with open(path, newline="", encoding="utf-8") as f:
+        return [
+            {k: v for k, v in row.items() if v not in (None, "")}
+            for row in csv.DictReader(f)
+        ]
+
+
+def load_customers_csv(data_dir: str | Path | None = None) -> list[dict]:
+    """Return `{customer_id, name}` for every customer in the seed CSV."""
+    data_dir = Path(data_dir) if data_dir is not None else DATA_DIR
+    return [
+        {"customer_id": c["customerId"], "name": c.get("name", "")}
+        for c in _read_csv(data_dir / "neo_customers.csv")
+    ]
+
+
+def load_customer_records_csv(
+    data_dir: str | Path | None = None,
+    customer_ids: list[str] | None = None,
+) -> list[dict]:
+    """Build the same records as `fetch_customer_records` from the seed CSVs."""
+    data_dir = Path(data_dir) if data_dir is not None else DATA_DIR
+    wanted = set(customer_ids) if customer_ids is not None else None
+
+    products = {p["ProductID"]: p for p in _read_csv(data_dir / "neo_products.csv")}
+    events = {e["EventID"]: e for e in _read_csv(data_dir / "neo_events.csv")}
+
+    records: dict[str, dict] = {}
+    for customer in _read_csv(data_dir / "neo_customers.csv"):
+        cid = customer["customerId"]
+        if wanted is None or cid in wanted:
+            records[cid] = {"customer": customer, "products": [], "events": []}
+
+    for rel in _read_csv(data_dir / "neo_cust_product_relationships.csv"):
+        record = records.get(rel["customerId"])
+        if record is not None and rel["productId"] in products:
+            record["products"].append(products[rel["productId"]])
+
+    for rel in _read_csv(data_dir / "neo_customer_event_relationships.csv"):
+        record = records.get(rel["customerId"])
+        if record is not None and rel["eventId"] in events:
+            record["events"].append(events[rel["eventId"]])
+
+    return list(records.values())
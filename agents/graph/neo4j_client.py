@@ -1,4 +1,3 @@
-from neo4j import GraphDatabase
 from config import NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD
 
 
@@ -6,6 +5,8 @@ class Neo4jClient:
     """Simple wrapper for Neo4j driver."""
 
     def __init__(self):
+        from neo4j import GraphDatabase
+
         self._driver = GraphDatabase.driver(
             NEO4J_URI,
             auth=(NEO4J_USER, NEO4J_PASSWORD),
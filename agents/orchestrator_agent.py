@@ -1,7 +1,55 @@
-from agents.sub_agents.text_to_cypher_agent import TextToCypherAgent
-from agents.sub_agents.cohort_agent import CohortAgent
-from agents.sub_agents.summary_agent import SummarizationAgent
-from agents.graph.neo4j_memory import Neo4jMemoryStore
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable
+
+from config import GRAPH_RETRIEVAL, SPECULATION_WORKERS, SPECULATION_MAX_AGE_S
+
+if TYPE_CHECKING:
+    from agents.sub_agents.text_to_cypher_agent import TextToCypherAgent
+    from agents.sub_agents.graph_search_agent import GraphSearchAgent
+    from agents.sub_agents.cohort_agent import CohortAgent
+    from agents.sub_agents.summary_agent import SummarizationAgent
+    from agents.graph.neo4j_memory import Neo4jMemoryStore
+
+
+CONTEXT_LIMIT = 10
+
+# Question-independent stages that `prepare` can run ahead of the question.
+SPECULATIVE_STAGES = ("cohort", "context", "open_events")
+
+
+class _StageRun:
+    """One background execution of a stage, with its timing."""
+
+    def __init__(self, stage: str, speculative: bool) -> None:
+        self.stage = stage
+        self.speculative = speculative
+        self.started: float | None = None
+        self.finished: float | None = None
+        self.future: Future | None = None
+        # Set by `_collect`: when the result was available to the query, and
+        # when it would have been had the stage only started with the query.
+        self.ready_at: float | None = None
+        self.unspeculated_ready_at: float | None = None
+
+    def call(self, fn: Callable[[], Any]) -> Any:
+        self.started = time.perf_counter()
+        try:
+            return fn()
+        finally:
+            self.finished = time.perf_counter()
+
+
+class _Speculation:
+    """Stages started by `prepare` for one session and customer."""
+
+    def __init__(self, customer_id: str) -> None:
+        self.customer_id = customer_id
+        self.created = time.monotonic()
+        self.runs: dict[str, _StageRun] = {}
 
 
 class OrchestratorAgent:
@@ -9,10 +57,19 @@ class OrchestratorAgent:
 
     Flow:
       1. Receive NL query.
-      2. Call TextToCypher agent (Neo4j).
+      2. Call TextToCypher agent and/or Graphiti hybrid search (Neo4j),
+         per `retrieval` ("cypher", "hybrid" or "both").
       3. Call Find Cohort agent (Google ADK via A2A).
       4. Call Summarization agent (Google ADK via A2A).
       5. Store conversation turns in Neo4j memory.
+
+    `prepare(session_id, customer_id)` starts the question-independent stages
+    (cohort lookup, recent context, open events) in the background as soon as
+    a customer is selected; `handle_query` picks up their finished or
+    in-flight results instead of starting from scratch.
+
+    Sub-agents that are not injected are built on first use, so importing and
+    constructing the orchestrator does not load LangChain / ADK / NumPy.
     """
 
     def __init__(
@@ -21,11 +78,218 @@ class OrchestratorAgent:
         text_to_cypher_agent: TextToCypherAgent | None = None,
         cohort_agent: CohortAgent | None = None,
         summarizer: SummarizationAgent | None = None,
+        graph_search_agent: GraphSearchAgent | None = None,
+        retrieval: str = GRAPH_RETRIEVAL,
     ):
-        self.memory = memory_store or Neo4jMemoryStore()
-        self.text_to_cypher_agent = text_to_cypher_agent or TextToCypherAgent()
-        self.cohort_agent = cohort_agent or CohortAgent()
-        self.summarizer = summarizer or SummarizationAgent()
+        if retrieval not in ("cypher", "hybrid", "both"):
+            raise ValueError(f"Unknown retrieval mode: {retrieval!r}")
+        self.retrieval = retrieval
+        self._memory = memory_store
+        self._text_to_cypher_agent = text_to_cypher_agent
+        self._graph_search_agent = graph_search_agent
+        self._cohort_agent = cohort_agent
+        self._summarizer = summarizer
+        self._init_lock = threading.RLock()
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._speculations: dict[str, _Speculation] = {}
+        self._spec_lock = threading.Lock()
+        self._spec_stats = {
+            stage: {"hits": 0, "in_flight": 0, "misses": 0, "invalidated": 0, "time_saved_s": 0.0}
+            for stage in SPECULATIVE_STAGES
+        }
+        # Per query: how much sooner all stages were ready (critical path).
+        self._spec_totals = {"queries": 0, "time_saved_s": 0.0, "evicted": 0}
+
+    def _lazy(self, attr: str, factory):
+        """Return `self.<attr>`, building it with `factory()` on first access."""
+        value = getattr(self, attr)
+        if value is None:
+            with self._init_lock:
+                value = getattr(self, attr)
+                if value is None:
+                    value = factory()
+                    setattr(self, attr, value)
+        return value
+
+    @property
+    def memory(self) -> Neo4jMemoryStore:
+        def build():
+            from agents.graph.neo4j_memory import Neo4jMemoryStore
+            return Neo4jMemoryStore()
+        return self._lazy("_memory", build)
+
+    @property
+    def text_to_cypher_agent(self) -> TextToCypherAgent:
+        def build():
+            from agents.sub_agents.text_to_cypher_agent import TextToCypherAgent
+            return TextToCypherAgent()
+        return self._lazy("_text_to_cypher_agent", build)
+
+    @property
+    def graph_search_agent(self) -> GraphSearchAgent:
+        def build():
+            from agents.sub_agents.graph_search_agent import GraphSearchAgent
+            return GraphSearchAgent()
+        return self._lazy("_graph_search_agent", build)
+
+    @property
+    def cohort_agent(self) -> CohortAgent:
+        def build():
+            from agents.sub_agents.cohort_agent import CohortAgent
+            return CohortAgent()
+        return self._lazy("_cohort_agent", build)
+
+    @property
+    def summarizer(self) -> SummarizationAgent:
+        def build():
+            from agents.sub_agents.summary_agent import SummarizationAgent
+            return SummarizationAgent()
+        return self._lazy("_summarizer", build)
+
+    def warm_up(self) -> None:
+        """Build every sub-agent now: drivers, graph schema, LLM clients, cohort index."""
+        self.memory.client.run_query("RETURN 1")
+        if self.retrieval in ("cypher", "both"):
+            self.text_to_cypher_agent
+        if self.retrieval in ("hybrid", "both"):
+            self.graph_search_agent.warm_up(require_index=True)
+        self.cohort_agent.warm_up()
+        self.summarizer
+
+    # --------------------------------------------------------------------- #
+    # Speculative precomputation
+    # --------------------------------------------------------------------- #
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        return self._lazy(
+            "_executor",
+            lambda: ThreadPoolExecutor(
+                max_workers=SPECULATION_WORKERS,
+                thread_name_prefix="orchestrator-stage",
+            ),
+        )
+
+    def _stage_fn(self, stage: str, session_id: str, customer_id: str | None) -> Callable[[], Any]:
+        if stage == "cohort":
+            return lambda: self.cohort_agent.find_cohorts(query="", customer_id=customer_id)
+        if stage == "context":
+            return lambda: self.memory.get_recent_context(session_id, limit=CONTEXT_LIMIT)
+        from agents.graph.customer_source import fetch_open_events
+        return lambda: fetch_open_events(self.memory.client, customer_id)
+
+    def _start_stage(self, stage: str, session_id: str, customer_id: str | None, speculative: bool) -> _StageRun:
+        run = _StageRun(stage, speculative)
+        run.future = self.executor.submit(run.call, self._stage_fn(stage, session_id, customer_id))
+        return run
+
+    def _invalidate(self, speculation: _Speculation) -> None:
+        for stage, run in speculation.runs.items():
+            run.future.cancel()
+            self._spec_stats[stage]["invalidated"] += 1
+
+    def prepare(self, session_id: str, customer_id: str | None) -> None:
+        """Start question-independent stages for this session's customer.
+
+        Safe to call on every UI rerun: a live speculation for the same
+        customer is kept, one for a different customer is invalidated.
+        Speculations older than SPECULATION_MAX_AGE_S are evicted here, for
+        every session, so abandoned sessions do not pile up.
+        """
+        with self._spec_lock:
+            self._evict_expired()
+            current = self._speculations.get(session_id)
+            if current is not None:
+                fresh = time.monotonic() - current.created < SPECULATION_MAX_AGE_S
+                if current.customer_id == customer_id and fresh:
+                    return
+                self._invalidate(self._speculations.pop(session_id))
+            if customer_id is None:
+                return
+            speculation = _Speculation(customer_id)
+            for stage in SPECULATIVE_STAGES:
+                speculation.runs[stage] = self._start_stage(stage, session_id, customer_id, speculative=True)
+            self._speculations[session_id] = speculation
+
+    def _evict_expired(self) -> None:
+        """Drop speculations past SPECULATION_MAX_AGE_S (caller holds the lock)."""
+        cutoff = time.monotonic() - SPECULATION_MAX_AGE_S
+        expired = [sid for sid, spec in self._speculations.items() if spec.created < cutoff]
+        for sid in expired:
+            self._invalidate(self._speculations.pop(sid))
+        self._spec_totals["evicted"] += len(expired)
+
+    def _claim(self, session_id: str, customer_id: str | None) -> _Speculation | None:
+        """Take the session's speculation if it is still valid for `customer_id`."""
+        with self._spec_lock:
+            speculation = self._speculations.pop(session_id, None)
+            if speculation is None:
+                return None
+            fresh = time.monotonic() - speculation.created < SPECULATION_MAX_AGE_S
+            if speculation.customer_id != customer_id or not fresh:
+                self._invalidate(speculation)
+                return None
+        return speculation
+
+    def _collect(
+        self,
+        run: _StageRun,
+        session_id: str,
+        customer_id: str | None,
+        query_started: float,
+    ) -> Any:
+        """Result of a stage run, recording hit / in-flight / miss and wait avoided.
+
+        The saving is measured against the same stage started at
+        `query_started` (as it would be without `prepare`): the difference in
+        when its result became available to this query, not its duration.
+        """
+        picked_up = time.perf_counter()
+        was_done = run.future.done()
+        try:
+            result = run.future.result()
+            finished, duration, speculative = run.finished, run.finished - run.started, run.speculative
+        except Exception:
+            if not run.speculative:
+                raise
+            # A failed speculation is retried inline and counted as a miss.
+            retry = _StageRun(run.stage, speculative=False)
+            result = retry.call(self._stage_fn(run.stage, session_id, customer_id))
+            finished, duration, speculative = retry.finished, 0.0, False
+
+        run.ready_at = max(picked_up, finished)
+        run.unspeculated_ready_at = (
+            max(picked_up, query_started + duration) if speculative else run.ready_at
+        )
+        with self._spec_lock:
+            stats = self._spec_stats[run.stage]
+            if not speculative:
+                stats["misses"] += 1
+            else:
+                stats["hits" if was_done else "in_flight"] += 1
+                stats["time_saved_s"] += max(0.0, run.unspeculated_ready_at - run.ready_at)
+        return result
+
+    def speculation_metrics(self) -> dict:
+        """Per-stage hit rate and time saved by `prepare`."""
+        with self._spec_lock:
+            stages = {}
+            for stage, stats in self._spec_stats.items():
+                used = stats["hits"] + stats["in_flight"]
+                total = used + stats["misses"]
+                stages[stage] = {
+                    **{k: v for k, v in stats.items() if k != "time_saved_s"},
+                    "hit_rate": used / total if total else 0.0,
+                    "time_saved_ms": round(stats["time_saved_s"] * 1000, 1),
+                }
+            return {
+                "stages": stages,
+                "queries": self._spec_totals["queries"],
+                "time_saved_ms": round(self._spec_totals["time_saved_s"] * 1000, 1),
+                "active": len(self._speculations),
+                "evicted": self._spec_totals["evicted"],
+            }
 
     def handle_query(
         self,
@@ -33,6 +297,16 @@ class OrchestratorAgent:
         query: str,
         customer_id: str | None = None,
     ) -> dict:
+        query_started = time.perf_counter()
+        speculation = self._claim(session_id, customer_id)
+
+        # A speculative context must be read before the question is logged,
+        # or an in-flight read could already include it; it is almost always
+        # finished by now. The question is then added as the newest turn.
+        early_context = None
+        if speculation:
+            early_context = self._collect(speculation.runs["context"], session_id, customer_id, query_started)
+
         # 1. log user query in memory
         self.memory.append_turn(
             session_id=session_id,
@@ -41,17 +315,43 @@ class OrchestratorAgent:
             customer_id=customer_id,
         )
 
-        # 2. fetch recent context (for summarization)
-        context = self.memory.get_recent_context(session_id, limit=10)
+        # 2. question-independent stages: use what `prepare` started, and
+        #    start the rest now so they overlap with graph retrieval
+        runs = {
+            stage: (speculation.runs[stage] if speculation else
+                    self._start_stage(stage, session_id, customer_id, speculative=False))
+            for stage in SPECULATIVE_STAGES
+        }
 
-        # 3. call Text-to-Cypher agent
-        t2c_result = self.text_to_cypher_agent.query(query+ f". for  Customer id {customer_id} ")
+        # 3. call Text-to-Cypher agent and/or hybrid graph search
+        graph_query = query + f". for  Customer id {customer_id} "
+        if self.retrieval == "hybrid":
+            t2c_result = self.graph_search_agent.query(graph_query)
+        else:
+            # "both": hybrid search runs on the executor alongside Text-to-Cypher
+            hybrid = (
+                self.executor.submit(self.graph_search_agent.query, graph_query)
+                if self.retrieval == "both" else None
+            )
+            t2c_result = self.text_to_cypher_agent.query(graph_query)
+            if hybrid is not None:
+                t2c_result["hybrid_rows"] = hybrid.result()["rows"]
 
-        # 4. call cohort agent
-        cohort_result = self.cohort_agent.find_cohorts(
-            query=query,
-            customer_id=customer_id,
-        )
+        # 4. recent context (for summarization), cohorts and open events
+        if early_context is not None:
+            context = ([{"role": "user", "text": query, "ts": None}] + list(early_context))[:CONTEXT_LIMIT]
+        else:
+            context = self._collect(runs["context"], session_id, customer_id, query_started)
+        cohort_result = self._collect(runs["cohort"], session_id, customer_id, query_started)
+        cohort_result = {
+            **cohort_result,
+            "open_events": self._collect(runs["open_events"], session_id, customer_id, query_started),
+        }
+        # Stages overlap, so the query only gains what its last stage gained.
+        saved = max(r.unspeculated_ready_at for r in runs.values()) - max(r.ready_at for r in runs.values())
+        with self._spec_lock:
+            self._spec_totals["queries"] += 1
+            self._spec_totals["time_saved_s"] += max(0.0, saved)
 
         #print('-------- Query ----------\n')
         #print(query)
@@ -72,6 +372,9 @@ class OrchestratorAgent:
             customer_id=customer_id,
         )
 
+        # 7. get ready for the rep's next question about the same customer
+        self.prepare(session_id, customer_id)
+
         return {
             "answer": final_answer,
             "text_to_cypher": t2c_result,
@@ -1,26 +1,32 @@
-from config import COHORT_AGENT_ID, GCP_PROJECT_ID, GCP_LOCATION
-import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-from .text_to_cypher_agent import TextToCypherAgent
+from .cohort_engine import CohortEngine
+
 
 class CohortAgent:
-    """Client wrapper for Google ADK 'Find Cohorts' agent, via A2A.
+    """'Find Cohorts' agent backed by the local vectorized CohortEngine.
 
-    Replace `_call_adk_agent` with your real A2A implementation.
+    Cohorts, similar customers and open events are answered from an
+    in-memory index built from the graph; no LLM call is made.
     """
 
-    def __init__(self):
-        self.agent_id = COHORT_AGENT_ID
-        self.project_id = GCP_PROJECT_ID
-        self.location = GCP_LOCATION
+    def __init__(self, engine: CohortEngine | None = None):
+        self.engine = engine or CohortEngine()
+
+    def warm_up(self) -> None:
+        """Build the cohort index now instead of on the first lookup."""
+        if not self.engine.is_built:
+            self.engine.build()
+
+    def refresh(self, customer_ids: list[str]) -> None:
+        """Re-index customers whose products or events changed."""
+        self.engine.refresh(customer_ids)
 
-    def _call_adk_agent(self, query: str, customer_id: str | None) -> dict:
-        # TODO: Implement the actual call to Google ADK / Vertex AI Agents.
-        # This is a stub that returns a plausible payload shape.
-        text_to_cypher_agent = TextToCypherAgent()
-        t2c_result = text_to_cypher_agent.query(f"Can you find all Open events that is assocoated with the customer {customer_id}")
-        return t2c_result
-        
     def find_cohorts(self, query: str, customer_id: str | None = None) -> dict:
-        return self._call_adk_agent(query=query, customer_id=customer_id)
+        if customer_id is None:
+            return {
+                "customer_id": None,
+                "cohorts": [],
+                "cohort": None,
+                "similar_customers": [],
+                "open_events": [],
+            }
+        return self.engine.find_cohorts(customer_id)
@@ -0,0 +1,456 @@
+from __future__ import annotations
+
+import math
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+# Loader signature: customer_ids (None = all customers) -> list of records shaped
+# like `{"customer": {...}, "products": [{...}], "events": [{...}]}`.
+RecordLoader = Callable[[Optional[List[str]]], List[Dict[str, Any]]]
+
+# Monetary fields are summed per customer and log-scaled.
+BALANCE_FIELDS = ("current balance", "Current Balance")
+CREDIT_LIMIT_FIELDS = ("Credit Limit",)
+LOAN_AMOUNT_FIELDS = ("Loan Amount",)
+LOAN_OUTSTANDING_FIELDS = ("Current outstanding Loan amount",)
+RATE_FIELDS = ("Interest rate", "Loan Interest")
+
+NUMERIC_FEATURES = (
+    "balance_total",
+    "credit_limit_total",
+    "loan_amount_total",
+    "loan_outstanding_total",
+    "avg_interest_rate",
+    "product_count",
+    "event_count",
+    "open_event_count",
+)
+
+# (feature prefix, source, property) for one-hot / count features.
+CATEGORICAL_FEATURES = (
+    ("product", "products", "Product"),
+    ("card", "products", "Card type"),
+    ("business", "products", "Business Category Type"),
+    ("event_type", "events", "event_type"),
+    ("event_status", "events", "event_status"),
+    ("sex", "customer", "sex"),
+    ("gender", "customer", "gender"),
+    ("ethnicity", "customer", "ethnicity"),
+)
+
+# Protected attributes: used as features, never shown in cohort labels by default.
+DEMOGRAPHIC_PREFIXES = ("sex", "gender", "ethnicity")
+
+FEATURE_DESCRIPTIONS = {
+    "balance_total": "high balances",
+    "credit_limit_total": "high credit limits",
+    "loan_amount_total": "large loans",
+    "loan_outstanding_total": "high outstanding loans",
+    "avg_interest_rate": "high interest rates",
+    "product_count": "many products",
+    "event_count": "frequent service events",
+    "open_event_count": "open service events",
+}
+
+
+def _to_float(value: Any) -> float | None:
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(str(value).replace("$", "").replace(",", "").strip())
+    except ValueError:
+        return None
+
+
+def _sum_fields(products: Iterable[dict], fields: tuple[str, ...]) -> float:
+    total = 0.0
+    for product in products:
+        for field in fields:
+            value = _to_float(product.get(field))
+            if value is not None:
+                total += value
+    return total
+
+
+def _category(value: Any) -> str | None:
+    if value is None or value == "":
+        return None
+    text = str(value).strip()
+    return text.lower() if text.lower() in ("open", "closed") else text
+
+
+def _is_open(event: dict) -> bool:
+    return str(event.get("event_status", "")).strip().lower() == "open"
+
+
+class CohortEngine:
+    """Vectorized customer cohort engine.
+
+    Builds one feature vector per customer (products, balances, loan/card
+    attributes, event types/statuses, demographics), clusters them with
+    spherical k-means and precomputes a top-k cosine nearest-neighbour index.
+    `find_cohorts` is then a pure in-memory lookup, and `refresh` re-vectorizes
+    only the customers whose products or events changed.
+    """
+
+    def __init__(
+        self,
+        loader: RecordLoader | None = None,
+        n_clusters: int | None = None,
+        n_neighbors: int = 10,
+        seed: int = 0,
+        block_size: int = 1024,
+        describe_demographics: bool = False,
+    ) -> None:
+        self._loader = loader or self._default_loader
+        self._describe_demographics = describe_demographics
+        self._n_clusters = n_clusters
+        self._n_neighbors = n_neighbors
+        self._seed = seed
+        self._block_size = block_size
+        self._lock = threading.RLock()
+
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._ids: List[str] = []
+        self._row: Dict[str, int] = {}
+        self._feature_names: List[str] = []
+        self._feature_index: Dict[str, int] = {}
+        self._mean: np.ndarray | None = None
+        self._std: np.ndarray | None = None
+        self._matrix: np.ndarray | None = None  # L2-normalized, (n, d)
+        self._centroids: np.ndarray | None = None  # (k, d)
+        self._labels: np.ndarray | None = None  # cluster per row, (n,)
+        self._cluster_sizes: np.ndarray | None = None  # (k,)
+        self._cluster_names: List[str] = []
+        self._cluster_profiles: List[List[str]] = []
+        self._nn_idx: np.ndarray | None = None  # (n, k) row indices
+        self._nn_sim: np.ndarray | None = None  # (n, k) cosine similarity
+
+    @staticmethod
+    def _default_loader(customer_ids: list[str] | None) -> list[dict]:
+        from agents.graph.customer_source import fetch_customer_records
+
+        return fetch_customer_records(customer_ids=customer_ids)
+
+    @property
+    def is_built(self) -> bool:
+        return self._matrix is not None
+
+    # --------------------------------------------------------------------- #
+    # Vectorization
+    # --------------------------------------------------------------------- #
+
+    @staticmethod
+    def _categories(record: dict) -> List[str]:
+        """All `prefix:value` categorical features of a record (with repeats)."""
+        names: List[str] = []
+        for prefix, source, field in CATEGORICAL_FEATURES:
+            if source == "customer":
+                items = [record.get("customer") or {}]
+            else:
+                items = record.get(source) or []
+            for item in items:
+                value = _category(item.get(field))
+                if value is not None:
+                    names.append(f"{prefix}:{value}")
+        return names
+
+    @staticmethod
+    def _numeric(record: dict) -> List[float]:
+        products = record.get("products") or []
+        events = record.get("events") or []
+        rates = [
+            rate
+            for product in products
+            for field in RATE_FIELDS
+            if (rate := _to_float(product.get(field))) is not None
+        ]
+        return [
+            math.log1p(max(_sum_fields(products, BALANCE_FIELDS), 0.0)),
+            math.log1p(max(_sum_fields(products, CREDIT_LIMIT_FIELDS), 0.0)),
+            math.log1p(max(_sum_fields(products, LOAN_AMOUNT_FIELDS), 0.0)),
+            math.log1p(max(_sum_fields(products, LOAN_OUTSTANDING_FIELDS), 0.0)),
+            sum(rates) / len(rates) if rates else 0.0,
+            float(len(products)),
+            float(len(events)),
+            float(sum(1 for e in events if _is_open(e))),
+        ]
+
+    def _raw_vectors(self, records: List[dict]) -> np.ndarray:
+        n_numeric = len(NUMERIC_FEATURES)
+        raw = np.zeros((len(records), len(self._feature_names)), dtype=np.float32)
+        for i, record in enumerate(records):
+            raw[i, :n_numeric] = self._numeric(record)
+            for name in self._categories(record):
+                col = self._feature_index.get(name)
+                if col is not None:
+                    raw[i, col] += 1.0
+        return raw
+
+    def _normalize(self, raw: np.ndarray) -> np.ndarray:
+        scaled = (raw - self._mean) / self._std
+        norms = np.linalg.norm(scaled, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (scaled / norms).astype(np.float32)
+
+    # --------------------------------------------------------------------- #
+    # Clustering and neighbour index
+    # --------------------------------------------------------------------- #
+
+    def _kmeans(self, X: np.ndarray, k: int, iterations: int = 25) -> tuple[np.ndarray, np.ndarray]:
+        """Spherical k-means with k-means++ seeding (cosine distance)."""
+        rng = np.random.default_rng(self._seed)
+        n = X.shape[0]
+        centroids = np.empty((k, X.shape[1]), dtype=np.float32)
+        centroids[0] = X[rng.integers(n)]
+        closest = 1.0 - X @ centroids[0]
+        for c in range(1, k):
+            weights = np.clip(closest, 0.0, None)
+            total = weights.sum()
+            pick = rng.choice(n, p=weights / total) if total > 0 else rng.integers(n)
+            centroids[c] = X[pick]
+            closest = np.minimum(closest, 1.0 - X @ centroids[c])
+
+        labels = np.full(n, -1, dtype=np.int32)
+        for _ in range(iterations):
+            new_labels = np.argmax(X @ centroids.T, axis=1).astype(np.int32)
+            if np.array_equal(new_labels, labels):
+                break
+            labels = new_labels
+            for c in range(k):
+                members = X[labels == c]
+                if len(members) == 0:
+                    continue
+                centroid = members.sum(axis=0)
+                norm = np.linalg.norm(centroid)
+                centroids[c] = centroid / norm if norm > 0 else centroid
+        return centroids, labels
+
+    def _describe_clusters(self) -> None:
+        n_numeric = len(NUMERIC_FEATURES)
+        describable = np.array(
+            [
+                col for col, name in enumerate(self._feature_names)
+                if self._describe_demographics
+                or name.split(":", 1)[0] not in DEMOGRAPHIC_PREFIXES
+            ],
+            dtype=np.int64,
+        )
+        self._cluster_names = []
+        self._cluster_profiles = []
+        for centroid in self._centroids:
+            ranked = describable[np.argsort(-centroid[describable], kind="stable")[:3]]
+            top = [int(col) for col in ranked if centroid[col] > 0]
+            profile = []
+            for col in top:
+                name = self._feature_names[col]
+                if col < n_numeric:
+                    profile.append(FEATURE_DESCRIPTIONS[name])
+                else:
+                    prefix, value = name.split(":", 1)
+                    profile.append(f"{value} {prefix.replace('_', ' ')}")
+            self._cluster_profiles.append(profile)
+            self._cluster_names.append(" / ".join(profile) if profile else "general")
+
+    def _neighbors_for(self, rows: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """Top-k neighbours (excluding self) for the given rows, blockwise."""
+        idx = np.empty((len(rows), k), dtype=np.int32)
+        sim = np.empty((len(rows), k), dtype=np.float32)
+        for start in range(0, len(rows), self._block_size):
+            block = rows[start:start + self._block_size]
+            scores = self._matrix[block] @ self._matrix.T
+            scores[np.arange(len(block)), block] = -np.inf
+            part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            part_scores = np.take_along_axis(scores, part, axis=1)
+            order = np.argsort(-part_scores, axis=1)
+            idx[start:start + len(block)] = np.take_along_axis(part, order, axis=1)
+            sim[start:start + len(block)] = np.take_along_axis(part_scores, order, axis=1)
+        return idx, sim
+
+    def _rebuild_neighbors(self) -> None:
+        n = len(self._ids)
+        k = min(self._n_neighbors, n - 1)
+        if k <= 0:
+            self._nn_idx = np.empty((n, 0), dtype=np.int32)
+            self._nn_sim = np.empty((n, 0), dtype=np.float32)
+            return
+        self._nn_idx, self._nn_sim = self._neighbors_for(np.arange(n), k)
+
+    # --------------------------------------------------------------------- #
+    # Public API
+    # --------------------------------------------------------------------- #
+
+    def build(self, records: List[dict] | None = None) -> "CohortEngine":
+        """(Re)build vectors, clusters and the neighbour index from scratch."""
+        with self._lock:
+            if records is None:
+                records = self._loader(None)
+            self._records = {
+                r["customer"]["customerId"]: r
+                for r in records
+                if (r.get("customer") or {}).get("customerId")
+            }
+            self._ids = list(self._records)
+            self._row = {cid: i for i, cid in enumerate(self._ids)}
+            ordered = [self._records[cid] for cid in self._ids]
+
+            categories = sorted({name for r in ordered for name in self._categories(r)})
+            self._feature_names = list(NUMERIC_FEATURES) + categories
+            self._feature_index = {name: i for i, name in enumerate(self._feature_names)}
+
+            raw = self._raw_vectors(ordered)
+            if len(ordered) == 0:
+                self._mean = np.zeros(raw.shape[1], dtype=np.float32)
+                self._std = np.ones(raw.shape[1], dtype=np.float32)
+                self._matrix = raw
+                self._centroids = np.empty((0, raw.shape[1]), dtype=np.float32)
+                self._labels = np.empty(0, dtype=np.int32)
+                self._cluster_sizes = np.empty(0, dtype=np.int64)
+                self._cluster_names, self._cluster_profiles = [], []
+                self._rebuild_neighbors()
+                return self
+
+            self._mean = raw.mean(axis=0)
+            std = raw.std(axis=0)
+            std[std == 0] = 1.0
+            self._std = std
+            self._matrix = self._normalize(raw)
+
+            n = len(self._ids)
+            k = self._n_clusters or max(1, min(50, round(math.sqrt(n / 2))))
+            self._centroids, self._labels = self._kmeans(self._matrix, min(k, n))
+            self._cluster_sizes = np.bincount(self._labels, minlength=len(self._centroids))
+            self._describe_clusters()
+            self._rebuild_neighbors()
+        return self
+
+    def refresh(self, customer_ids: Iterable[str]) -> None:
+        """Re-vectorize customers whose products or events changed.
+
+        New customers are appended and handled like changed ones; removed
+        customers, previously unseen categories or a change in the neighbour
+        count fall back to a full rebuild. Centroids and scaling stats are
+        kept, so changed customers are reassigned to the nearest existing
+        cohort and only neighbour lists that can be affected are recomputed.
+        """
+        customer_ids = list(dict.fromkeys(customer_ids))
+        if not customer_ids:
+            return
+        with self._lock:
+            if not self.is_built:
+                self.build()
+                return
+
+            fetched = {
+                r["customer"]["customerId"]: r
+                for r in self._loader(customer_ids)
+                if (r.get("customer") or {}).get("customerId")
+            }
+            removed = [cid for cid in customer_ids if cid not in fetched and cid in self._row]
+            unseen = any(
+                name not in self._feature_index
+                for r in fetched.values()
+                for name in self._categories(r)
+            )
+            self._records.update(fetched)
+            if removed or unseen or len(self._centroids) == 0:
+                for cid in removed:
+                    self._records.pop(cid, None)
+                self.build(list(self._records.values()))
+                return
+            if not fetched:
+                return  # unknown or already-removed ids: nothing to re-index
+
+            new_ids = [cid for cid in fetched if cid not in self._row]
+            if new_ids:
+                start = len(self._ids)
+                self._ids.extend(new_ids)
+                self._row.update({cid: start + i for i, cid in enumerate(new_ids)})
+                pad = np.zeros((len(new_ids), self._matrix.shape[1]), dtype=np.float32)
+                self._matrix = np.vstack([self._matrix, pad])
+                self._labels = np.concatenate(
+                    [self._labels, np.zeros(len(new_ids), dtype=np.int32)]
+                )
+                # Placeholder neighbour rows; new rows count as changed below.
+                self._nn_idx = np.vstack(
+                    [self._nn_idx, np.zeros((len(new_ids), self._nn_idx.shape[1]), dtype=np.int32)]
+                )
+                self._nn_sim = np.vstack(
+                    [self._nn_sim, np.full((len(new_ids), self._nn_sim.shape[1]), -np.inf, dtype=np.float32)]
+                )
+
+            changed = np.array([self._row[cid] for cid in fetched], dtype=np.int32)
+            vectors = self._normalize(self._raw_vectors([fetched[cid] for cid in fetched]))
+            self._matrix[changed] = vectors
+            self._labels[changed] = np.argmax(vectors @ self._centroids.T, axis=1)
+            self._cluster_sizes = np.bincount(self._labels, minlength=len(self._centroids))
+
+            n = len(self._ids)
+            k = min(self._n_neighbors, n - 1)
+            if self._nn_idx.shape[1] != k or k <= 0:
+                self._rebuild_neighbors()
+                return
+
+            # A row's top-k can only change if it pointed at a changed customer
+            # or a changed (or new) customer now beats its current k-th neighbour.
+            to_changed = self._matrix @ self._matrix[changed].T
+            to_changed[changed, np.arange(len(changed))] = -np.inf
+            affected = np.isin(self._nn_idx, changed).any(axis=1)
+            affected |= to_changed.max(axis=1) > self._nn_sim[:, -1]
+            affected[changed] = True
+            rows = np.flatnonzero(affected)
+            self._nn_idx[rows], self._nn_sim[rows] = self._neighbors_for(rows, k)
+
+    def find_cohorts(self, customer_id: str, top_k: int | None = None) -> Dict[str, Any]:
+        """Cohort, most similar customers and open events for one customer."""
+        with self._lock:
+            if not self.is_built:
+                self.build()
+            row = self._row.get(customer_id)
+            if row is None:
+                return {
+                    "customer_id": customer_id,
+                    "cohorts": [],
+                    "cohort": None,
+                    "similar_customers": [],
+                    "open_events": [],
+                }
+
+            cluster = int(self._labels[row])
+            top_k = self._nn_idx.shape[1] if top_k is None else top_k
+            similar = [
+                {
+                    "customer_id": self._ids[j],
+                    "name": self._records[self._ids[j]]["customer"].get("name"),
+                    "similarity": round(float(s), 4),
+                    "cohort_id": int(self._labels[j]),
+                }
+                for j, s in zip(self._nn_idx[row][:top_k], self._nn_sim[row][:top_k])
+            ]
+            open_events = [
+                {
+                    "eventId": e.get("EventID"),
+                    "eventType": e.get("event_type"),
+                    "eventMessage": e.get("event_message"),
+                    "eventOpenDate": e.get("event_open_date"),
+                }
+                for e in self._records[customer_id].get("events") or []
+                if _is_open(e)
+            ]
+            return {
+                "customer_id": customer_id,
+                "cohorts": [self._cluster_names[cluster]],
+                "cohort": {
+                    "id": cluster,
+                    "label": self._cluster_names[cluster],
+                    "profile": self._cluster_profiles[cluster],
+                    "size": int(self._cluster_sizes[cluster]),
+                },
+                "similar_customers": similar,
+                "open_events": open_events,
+            }
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List
+
+from config import (
+    NEO4J_URI,
+    NEO4J_USER,
+    NEO4J_PASSWORD,
+    OPENAI_API_KEY,
+    GRAPHITI_EMBEDDER,
+    GRAPHITI_EMBEDDING_MODEL,
+    EMBEDDING_CACHE_SIZE,
+    EMBEDDING_BATCH_WINDOW_MS,
+)
+
+
+class GraphSearchAgent:
+    """Long-lived Graphiti hybrid search (BM25 + vector + graph) over Neo4j.
+
+    Alternative / complement to TextToCypherAgent. One Graphiti instance (and
+    its pooled async Neo4j driver) lives on a private event loop thread for
+    the lifetime of the agent; indices and constraints are built once, on
+    first use. Query embeddings go through an LRU cache and are batched
+    across concurrent callers.
+
+    Graphiti only searches the facts it extracted from ingested episodes, not
+    nodes loaded by the CSV import, so the graph must be populated with
+    `ingest` (see `data/ingest_graphiti.py`) first. `query` and
+    `warm_up(require_index=True)` refuse to run against an empty index.
+    """
+
+    def __init__(
+        self,
+        embedder: str = GRAPHITI_EMBEDDER,
+        num_results: int = 10,
+        cache_size: int = EMBEDDING_CACHE_SIZE,
+        batch_window_ms: float = EMBEDDING_BATCH_WINDOW_MS,
+    ) -> None:
+        from .graphiti_embedders import build_embedder
+
+        self.num_results = num_results
+        self.embedder = build_embedder(
+            kind=embedder,
+            model=GRAPHITI_EMBEDDING_MODEL,
+            api_key=OPENAI_API_KEY,
+            cache_size=cache_size,
+            batch_window_ms=batch_window_ms,
+        )
+
+        self._graphiti: Any = None
+        self._indexed = False
+        self._ready_lock = asyncio.Lock()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="graph-search-loop",
+            daemon=True,
+        )
+        self._thread.start()
+
+    # --------------------------------------------------------------------- #
+    # Internal helpers
+    # --------------------------------------------------------------------- #
+
+    def _run(self, coro):
+        """Run `coro` on the agent's loop and wait for the result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def _ensure_ready(self) -> Any:
+        if self._graphiti is not None:
+            return self._graphiti
+        async with self._ready_lock:
+            if self._graphiti is None:
+                from graphiti_core import Graphiti
+                from graphiti_core.llm_client import LLMConfig, OpenAIClient
+
+                graphiti = Graphiti(
+                    NEO4J_URI,
+                    NEO4J_USER,
+                    NEO4J_PASSWORD,
+                    llm_client=OpenAIClient(config=LLMConfig(api_key=OPENAI_API_KEY)),
+                    embedder=self.embedder,
+                )
+                await graphiti.build_indices_and_constraints(delete_existing=False)
+                self._graphiti = graphiti
+        return self._graphiti
+
+    async def _has_facts(self) -> bool:
+        graphiti = await self._ensure_ready()
+        result = await graphiti.driver.execute_query(
+            "MATCH (:Entity)-[e:RELATES_TO]->(:Entity) RETURN e.uuid AS uuid LIMIT 1"
+        )
+        return bool(result.records)
+
+    async def _require_index(self) -> None:
+        if not self._indexed:
+            self._indexed = await self._has_facts()
+        if not self._indexed:
+            raise RuntimeError(
+                "Graphiti index is empty: hybrid search only sees ingested episodes. "
+                "Run `python data/ingest_graphiti.py` first."
+            )
+
+    async def _ingest(self, records: List[Dict[str, Any]], group_id: str | None) -> int:
+        from graphiti_core.nodes import EpisodeType
+
+        graphiti = await self._ensure_ready()
+        count = 0
+        # Sequential: Graphiti dedupes entities against earlier episodes.
+        for record in records:
+            customer = record.get("customer") or {}
+            customer_id = customer.get("customerId")
+            if not customer_id:
+                continue
+            await graphiti.add_episode(
+                name=f"customer {customer_id}",
+                episode_body=json.dumps(record, default=str),
+                source=EpisodeType.json,
+                source_description="customer profile with its products and events",
+                reference_time=datetime.now(timezone.utc),
+                group_id=group_id,
+            )
+            count += 1
+        self._indexed = self._indexed or count > 0
+        return count
+
+    async def _search(self, query: str, num_results: int) -> List[Dict[str, Any]]:
+        graphiti = await self._ensure_ready()
+        edges = await graphiti.search(query=query, num_results=num_results)
+        return [
+            {
+                "fact": edge.fact,
+                "relation": edge.name,
+                "source_node_uuid": edge.source_node_uuid,
+                "target_node_uuid": edge.target_node_uuid,
+                "valid_at": edge.valid_at.isoformat() if edge.valid_at else None,
+            }
+            for edge in edges
+        ]
+
+    async def _search_many(self, queries: List[str], num_results: int) -> List[List[Dict[str, Any]]]:
+        return list(await asyncio.gather(*(self._search(q, num_results) for q in queries)))
+
+    # --------------------------------------------------------------------- #
+    # Public API
+    # --------------------------------------------------------------------- #
+
+    def warm_up(self, require_index: bool = False) -> None:
+        """Connect and build indices now instead of on the first query."""
+        self._run(self._require_index() if require_index else self._ensure_ready())
+
+    def is_indexed(self) -> bool:
+        """True once Graphiti holds at least one searchable fact."""
+        self._indexed = self._indexed or self._run(self._has_facts())
+        return self._indexed
+
+    def ingest(self, records: Iterable[Dict[str, Any]], group_id: str | None = None) -> int:
+        """Add `{customer, products, events}` records as Graphiti episodes.
+
+        Records come from `customer_source` (graph or seed CSVs). Each one is
+        an LLM extraction call, so this is an offline/batch step. Returns the
+        number of episodes added.
+        """
+        return self._run(self._ingest(list(records), group_id))
+
+    def search(self, query: str, num_results: int | None = None) -> List[Dict[str, Any]]:
+        return self._run(self._search(query, num_results or self.num_results))
+
+    def search_many(self, queries: List[str], num_results: int | None = None) -> List[List[Dict[str, Any]]]:
+        """Run several searches concurrently; their embeddings share one batch."""
+        return self._run(self._search_many(list(queries), num_results or self.num_results))
+
+    def query(self, nl_query: str) -> dict:
+        """Same result shape as TextToCypherAgent.query (no Cypher is generated)."""
+        if not self._indexed:
+            self._run(self._require_index())
+        rows = self.search(nl_query)
+        return {
+            "answer": "\n".join(row["fact"] for row in rows if row["fact"]),
+            "cypher": "",
+            "rows": rows,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return self.embedder.stats()
+
+    def close(self) -> None:
+        if self._graphiti is not None:
+            self._run(self._graphiti.close())
+            self._graphiti = None
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
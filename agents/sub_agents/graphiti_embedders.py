@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import math
+import re
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from graphiti_core.embedder.client import EMBEDDING_DIM, EmbedderClient
+
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+class LocalHashingEmbedder(EmbedderClient):
+    """Deterministic offline embedder (feature hashing of words and trigrams).
+
+    Stand-in for OpenAI embeddings so the search path can be benchmarked
+    without network access. Vectors are not comparable with OpenAI vectors
+    already stored in Neo4j, so do not mix the two against one database.
+    """
+
+    def __init__(self, dim: int = EMBEDDING_DIM) -> None:
+        self.dim = dim
+
+    def _embed(self, text: str) -> List[float]:
+        vector = [0.0] * self.dim
+        text = text.lower()
+        features = _TOKEN_RE.findall(text)
+        features += [text[i:i + 3] for i in range(len(text) - 2)]
+        for feature in features:
+            digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            vector[value % self.dim] += 1.0 if value >> 63 else -1.0
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return [v / norm for v in vector]
+
+    async def create(self, input_data: Any) -> List[float]:
+        if isinstance(input_data, list) and input_data and isinstance(input_data[0], str):
+            input_data = input_data[0]
+        return self._embed(str(input_data))
+
+    async def create_batch(self, input_data_list: List[str]) -> List[List[float]]:
+        return [self._embed(text) for text in input_data_list]
+
+
+class CachingBatchingEmbedder(EmbedderClient):
+    """Wraps another embedder with an LRU cache and request coalescing.
+
+    Concurrent single-text `create` calls that miss the cache are collected
+    for up to `batch_window_ms` (or until `batch_size` texts are pending) and
+    sent as one `create_batch` call. Identical in-flight texts share a
+    single request. Must be used from one event loop.
+    """
+
+    def __init__(
+        self,
+        inner: EmbedderClient,
+        cache_size: int = 4096,
+        batch_size: int = 64,
+        batch_window_ms: float = 5.0,
+    ) -> None:
+        self._inner = inner
+        self._cache_size = cache_size
+        self._batch_size = batch_size
+        self._batch_window = batch_window_ms / 1000.0
+
+        self._cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0  # joined an identical in-flight request
+        self.batches = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "batches": self.batches,
+            "avg_batch_size": self.misses / self.batches if self.batches else 0.0,
+            "cached": len(self._cache),
+        }
+
+    # --------------------------------------------------------------------- #
+    # EmbedderClient API
+    # --------------------------------------------------------------------- #
+
+    async def create(self, input_data: Any) -> List[float]:
+        # Graphiti embeds search queries as a one-element list.
+        if isinstance(input_data, str):
+            return await self._embed(input_data)
+        if isinstance(input_data, list) and len(input_data) == 1 and isinstance(input_data[0], str):
+            return await self._embed(input_data[0])
+        return await self._inner.create(input_data)
+
+    async def create_batch(self, input_data_list: List[str]) -> List[List[float]]:
+        return list(await asyncio.gather(*(self._embed(text) for text in input_data_list)))
+
+    # --------------------------------------------------------------------- #
+    # Internal helpers
+    # --------------------------------------------------------------------- #
+
+    async def _embed(self, text: str) -> List[float]:
+        cached = self._cache.get(text)
+        if cached is not None:
+            self._cache.move_to_end(text)
+            self.hits += 1
+            return cached
+
+        future = self._pending.get(text)
+        if future is None:
+            self.misses += 1
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[text] = future
+            if len(self._pending) >= self._batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self._batch_window, self._flush)
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            asyncio.ensure_future(self._run_batch(batch))
+
+    async def _run_batch(self, batch: Dict[str, asyncio.Future]) -> None:
+        texts = list(batch)
+        try:
+            vectors = await self._inner.create_batch(texts)
+        except Exception as exc:  # propagate to every waiter
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        self.batches += 1
+        for text, vector in zip(texts, vectors):
+            self._cache[text] = vector
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+            if not batch[text].done():
+                batch[text].set_result(vector)
+        for future in batch.values():
+            if not future.done():
+                future.set_exception(RuntimeError("Embedder returned fewer vectors than inputs"))
+
+
+def build_embedder(
+    kind: str = "openai",
+    model: str = "text-embedding-3-small",
+    api_key: str | None = None,
+    cache_size: int = 4096,
+    batch_size: int = 64,
+    batch_window_ms: float = 5.0,
+) -> CachingBatchingEmbedder:
+    """Create the cached/batched embedder; `kind` is "openai" or "local"."""
+    if kind == "local":
+        inner: EmbedderClient = LocalHashingEmbedder()
+    elif kind == "openai":
+        from graphiti_core.embedder.openai import OpenAIEmbedder, OpenAIEmbedderConfig
+
+        inner = OpenAIEmbedder(
+            config=OpenAIEmbedderConfig(api_key=api_key, embedding_model=model)
+        )
+    else:
+        raise ValueError(f"Unknown embedder kind: {kind!r} (expected 'openai' or 'local')")
+    return CachingBatchingEmbedder(
+        inner,
+        cache_size=cache_size,
+        batch_size=batch_size,
+        batch_window_ms=batch_window_ms,
+    )
@@ -1,11 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from typing import List, Dict, Any, Optional
-
-from google.genai.types import UserContent, Part
-from google.adk.agents import LlmAgent
-from google.adk.runners import InMemoryRunner
+from typing import List, Dict, Any
 
 
 SUMMARY_SYSTEM_PROMPT = """
@@ -39,7 +35,10 @@ class SummarizationAgent:
     This agent:
       - Builds a structured user message from orchestrator outputs
       - Delegates summarization to an LLM with a strong system prompt
-      - Maintains an in-memory session for conversational continuity
+      - Runs every call in its own short-lived in-memory session; continuity
+        comes from the conversation_context the caller passes in, so one agent
+        can be shared across UI sessions, customers and threads without their
+        prompts leaking into each other
     """
 
     def __init__(
@@ -52,6 +51,10 @@ class SummarizationAgent:
         self._user_id = user_id
         self._debug = debug
 
+        # Google ADK is imported lazily so module import stays cheap.
+        from google.adk.agents import LlmAgent
+        from google.adk.runners import InMemoryRunner
+
         # LLM agent responsible for text generation
         self._llm_agent = LlmAgent(
             name="CustSvcSummarizeAgent",
@@ -66,9 +69,6 @@ class SummarizationAgent:
             app_name=app_name,
         )
 
-        # Lazy-created and reused session
-        self._session: Optional[Any] = None
-
     # --------------------------------------------------------------------- #
     # Internal helpers
     # --------------------------------------------------------------------- #
@@ -136,12 +136,21 @@ class SummarizationAgent:
             user_id=self._user_id,
         )
 
-    def _get_or_create_session(self) -> Any:
-        """Get the existing session or create a new one."""
-        if self._session is None:
-            self._session = asyncio.run(self._create_session_async())
-            self._log(f"Created new session: {self._session.id}")
-        return self._session
+    def _create_session(self) -> Any:
+        """Create a fresh session for a single summarize call."""
+        session = asyncio.run(self._create_session_async())
+        self._log(f"Created new session: {session.id}")
+        return session
+
+    def _delete_session(self, session: Any) -> None:
+        """Drop a finished session so the in-memory store does not grow."""
+        asyncio.run(
+            self._runner.session_service.delete_session(
+                app_name=self._runner.app_name,
+                user_id=self._user_id,
+                session_id=session.id,
+            )
+        )
 
     # --------------------------------------------------------------------- #
     # Public API
@@ -167,6 +176,8 @@ class SummarizationAgent:
             A formatted summary string following SUMMARY_SYSTEM_PROMPT rules.
         """
 
+        from google.genai.types import UserContent, Part
+
         payload = {
             "original_query": original_query,
             "text_to_cypher_result": text_to_cypher_result,
@@ -184,24 +195,27 @@ class SummarizationAgent:
         #self._log("--- End User Message ----")
 
         user_message = UserContent(parts=[Part(text=user_message_str)])
-        session = self._get_or_create_session()
+        session = self._create_session()
 
         summary_chunks: List[str] = []
 
-        for event in self._runner.run(
-            user_id=self._user_id,
-            session_id=session.id,
-            new_message=user_message,
-        ):
-            # Events can be tool calls, internal state, etc. We only care about text parts.
-            content = getattr(event, "content", None)
-            if not content:
-                continue
-
-            for part in getattr(content, "parts", []) or []:
-                text = getattr(part, "text", None)
-                if text:
-                    summary_chunks.append(text)
+        try:
+            for event in self._runner.run(
+                user_id=self._user_id,
+                session_id=session.id,
+                new_message=user_message,
+            ):
+                # Events can be tool calls, internal state, etc. We only care about text parts.
+                content = getattr(event, "content", None)
+                if not content:
+                    continue
+
+                for part in getattr(content, "parts", []) or []:
+                    text = getattr(part, "text", None)
+                    if text:
+                        summary_chunks.append(text)
+        finally:
+            self._delete_session(session)
 
         response = "".join(summary_chunks).strip()
 
@@ -1,10 +1,4 @@
-from langchain_openai import ChatOpenAI
-from langchain.prompts import PromptTemplate
-from langchain_neo4j import GraphCypherQAChain, Neo4jGraph
 from config import OPENAI_API_KEY, NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD
-import os
-
-os.environ["OPENAI_API_KEY"] = OPENAI_API_KEY or ""
 
 # Explicit domain schema based on your uploaded CSVs and Neo4j constraints.
 # The LangChain Neo4jGraph will also inject the runtime schema into {schema}.
@@ -119,6 +113,12 @@ class TextToCypherAgent:
     """NL -> Cypher -> execute on Neo4j and return JSON-like result."""
 
     def __init__(self):
+        # LangChain SDKs are imported here, not at module scope, so importing
+        # the orchestrator stays cheap until the agent is actually built.
+        from langchain_openai import ChatOpenAI
+        from langchain.prompts import PromptTemplate
+        from langchain_neo4j import GraphCypherQAChain, Neo4jGraph
+
         self.graph = Neo4jGraph(
             url=NEO4J_URI,
             username=NEO4J_USER,
@@ -129,7 +129,11 @@ class TextToCypherAgent:
 
         #print(self.graph.schema)
 
-        self.llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+        self.llm = ChatOpenAI(
+            model="gpt-4o-mini",
+            temperature=0,
+            api_key=OPENAI_API_KEY or "",
+        )
 
         cypher_prompt = PromptTemplate(
             template=CYPHER_SYSTEM_PROMPT,
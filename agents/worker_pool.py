@@ -0,0 +1,660 @@
+from __future__ import annotations
+
+import hashlib
+import itertools
+import multiprocessing as mp
+import os
+import random
+import threading
+import time
+import traceback
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import Future
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, Dict, List
+
+from config import (
+    ORCHESTRATOR_WORKERS,
+    WORKER_MAX_REQUESTS,
+    WORKER_MAX_REQUESTS_JITTER,
+    WORKER_REQUEST_TIMEOUT_S,
+    WORKER_HEARTBEAT_S,
+)
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class ConsistentHashRing:
+    """Maps keys to worker slots; each slot owns `vnodes` points on the ring."""
+
+    def __init__(self, slots: List[int], vnodes: int = 128) -> None:
+        points = sorted((_hash(f"worker-{slot}#{v}"), slot) for slot in slots for v in range(vnodes))
+        self._hashes = [h for h, _ in points]
+        self._slots = [slot for _, slot in points]
+
+    def lookup(self, key: str, exclude: set[int] = frozenset()) -> int:
+        """Slot owning `key`; walks clockwise past any `exclude`d slots."""
+        start = bisect_right(self._hashes, _hash(key))
+        for i in range(len(self._slots)):
+            slot = self._slots[(start + i) % len(self._slots)]
+            if slot not in exclude:
+                return slot
+        raise RuntimeError("No healthy workers available")
+
+
+def _merge_speculation(reports: List[Dict[str, Any] | None]) -> Dict[str, Any] | None:
+    """Sum OrchestratorAgent.speculation_metrics() reports from several workers."""
+    reports = [r for r in reports if r]
+    if not reports:
+        return None
+    stages: Dict[str, Dict[str, Any]] = {}
+    for report in reports:
+        for stage, stats in report["stages"].items():
+            merged = stages.setdefault(
+                stage, {"hits": 0, "in_flight": 0, "misses": 0, "invalidated": 0, "time_saved_ms": 0.0}
+            )
+            for key in merged:
+                merged[key] += stats.get(key, 0)
+    for merged in stages.values():
+        used = merged["hits"] + merged["in_flight"]
+        total = used + merged["misses"]
+        merged["hit_rate"] = used / total if total else 0.0
+        merged["time_saved_ms"] = round(merged["time_saved_ms"], 1)
+    totals = {
+        key: sum(report.get(key, 0) for report in reports)
+        for key in ("queries", "time_saved_ms", "active", "evicted")
+    }
+    totals["time_saved_ms"] = round(totals["time_saved_ms"], 1)
+    return {"stages": stages, **totals}
+
+
+def _default_agent_factory():
+    from agents.orchestrator_agent import OrchestratorAgent
+
+    return OrchestratorAgent()
+
+
+def _worker_main(
+    slot: int,
+    requests: mp.Queue,
+    responses: Connection,
+    agent_factory: Callable[[], Any],
+    max_requests: int,
+    heartbeat_s: float,
+) -> None:
+    """Worker process: warm one orchestrator, then serve its queue.
+
+    Replies go over a private pipe, so a crashing worker cannot leave a
+    shared lock held; the parent sees EOF once the process is gone. A
+    heartbeat thread reports in over the same pipe, independent of the
+    request loop, and "started" marks when each request is picked up.
+    """
+    pid = os.getpid()
+    send_lock = threading.Lock()
+
+    def send(message: tuple) -> None:
+        with send_lock:
+            responses.send(message)
+
+    started = time.perf_counter()
+    try:
+        agent = agent_factory()
+        agent.warm_up()
+    except Exception:
+        send(("failed", traceback.format_exc()))
+        return
+    send(("ready", pid, time.perf_counter() - started))
+
+    handled = 0
+
+    def heartbeat() -> None:
+        while True:
+            time.sleep(heartbeat_s)
+            stats: Dict[str, Any] = {"pid": pid, "handled": handled}
+            if hasattr(agent, "speculation_metrics"):
+                stats["speculation"] = agent.speculation_metrics()
+            try:
+                send(("heartbeat", stats))
+            except OSError:
+                return
+
+    threading.Thread(target=heartbeat, name="worker-heartbeat", daemon=True).start()
+
+    while True:
+        message = requests.get()
+        if message is None:
+            return
+        kind, req_id, kwargs = message
+        send(("started", req_id))
+        started = time.perf_counter()
+        try:
+            if kind == "prepare":
+                payload = agent.prepare(**kwargs)
+            else:
+                payload = agent.handle_query(**kwargs)
+            ok = True
+        except Exception:
+            payload, ok = traceback.format_exc(), False
+        handled += kind == "query"
+        send(("result", req_id, ok, payload, time.perf_counter() - started))
+
+        if kind == "query" and handled == max_requests:
+            # Keep serving; the parent retires this process once its
+            # replacement is warm.
+            send(("recycle", handled))
+
+
+class _SlotDead(RuntimeError):
+    """The slot gave up between routing and sending; the caller re-routes."""
+
+
+class _Worker:
+    """One worker process with its own request queue and reply pipe."""
+
+    def __init__(self, process: mp.Process, requests: mp.Queue, conn: Connection) -> None:
+        self.process = process
+        self.requests = requests
+        self.conn: Connection | None = conn
+        self.ready = threading.Event()
+        self.spawned = time.monotonic()
+        self.heartbeat = self.spawned
+        self.outstanding: deque[str] = deque()  # FIFO, matches worker order
+        self.in_flight: tuple[str, float] | None = None  # (req_id, picked up at)
+        self.stats: Dict[str, Any] = {}  # from the latest heartbeat
+        self.timed_out = False
+
+
+class _Slot:
+    """Parent-side state of one worker slot.
+
+    `worker` takes new requests. `standby` is a replacement warming up for
+    a recycle, and `retiring` holds old processes draining their queue.
+    """
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.worker: _Worker | None = None
+        self.standby: _Worker | None = None
+        self.retiring: List[_Worker] = []
+        self.start_failures = 0
+        self.dead = False
+
+        self.handled = 0
+        self.errors = 0
+        self.recycles = 0
+        self.restarts = 0
+        self.timeouts = 0
+        self.warm_s = 0.0
+        self.latencies: deque[float] = deque(maxlen=1000)
+        self.past_speculation: Dict[str, Any] | None = None  # from exited processes
+
+    def workers(self) -> List[_Worker]:
+        return [w for w in (self.worker, self.standby, *self.retiring) if w is not None]
+
+    def speculation(self) -> Dict[str, Any] | None:
+        """Speculation stats of this slot since the pool started, across recycles."""
+        return _merge_speculation(
+            [self.past_speculation] + [w.stats.get("speculation") for w in self.workers()]
+        )
+
+
+class OrchestratorPool:
+    """Pool of worker processes, each running a fully warmed OrchestratorAgent.
+
+    Requests are routed by consistent hash of `customer_id` (falling back to
+    `session_id`), so a customer's per-process caches and conversation state
+    stay on one worker. After about `max_requests` (plus up to
+    `max_requests_jitter`, so workers do not all recycle together) a
+    replacement is warmed up next to the worker and takes over its slot
+    once ready; the old process drains its queue and exits. Workers that
+    die are restarted, and a request running longer than `request_timeout`
+    gets its worker terminated and restarted. Replacements take over the
+    same slot, so routing does not move. Exposes the same `handle_query`
+    signature as OrchestratorAgent.
+    """
+
+    def __init__(
+        self,
+        workers: int = ORCHESTRATOR_WORKERS or os.cpu_count() or 1,
+        max_requests: int = WORKER_MAX_REQUESTS,
+        agent_factory: Callable[[], Any] = _default_agent_factory,
+        start_method: str = "spawn",
+        ready_timeout: float = 300.0,
+        max_start_failures: int = 3,
+        max_requests_jitter: int = WORKER_MAX_REQUESTS_JITTER,
+        request_timeout: float = WORKER_REQUEST_TIMEOUT_S,
+        heartbeat_s: float = WORKER_HEARTBEAT_S,
+    ) -> None:
+        self._ctx = mp.get_context(start_method)
+        self._max_requests = max_requests
+        self._max_requests_jitter = max_requests_jitter
+        self._agent_factory = agent_factory
+        self._ready_timeout = ready_timeout
+        self._max_start_failures = max_start_failures
+        self._request_timeout = request_timeout
+        self._heartbeat_s = heartbeat_s
+
+        self._slots = [_Slot(i) for i in range(workers)]
+        self._ring = ConsistentHashRing([slot.index for slot in self._slots])
+
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+        # req_id -> (future, kind, submitted_at, message) for replay after a crash
+        self._pending: Dict[str, tuple[Future, str, float, tuple]] = {}
+        # session_id -> slot its last query/prepare went to (holds its speculation)
+        self._session_slots: Dict[str, int] = {}
+        self._collector: threading.Thread | None = None
+        self._closed = False
+
+    # --------------------------------------------------------------------- #
+    # Lifecycle
+    # --------------------------------------------------------------------- #
+
+    def _spawn(self, slot: _Slot) -> _Worker:
+        requests = self._ctx.Queue()
+        reader, writer = self._ctx.Pipe(duplex=False)
+        max_requests = self._max_requests
+        if max_requests:
+            max_requests += random.randint(0, max(0, self._max_requests_jitter))
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(slot.index, requests, writer, self._agent_factory, max_requests, self._heartbeat_s),
+            name=f"orchestrator-worker-{slot.index}",
+            daemon=True,
+        )
+        process.start()
+        writer.close()  # only the worker holds the write end, so its exit means EOF
+        return _Worker(process, requests, reader)
+
+    def start(self) -> "OrchestratorPool":
+        """Start every worker and block until all are warmed up."""
+        for slot in self._slots:
+            slot.worker = self._spawn(slot)
+        self._collector = threading.Thread(target=self._collect, name="orchestrator-pool", daemon=True)
+        self._collector.start()
+
+        deadline = time.monotonic() + self._ready_timeout
+        for slot in self._slots:
+            while not slot.worker.ready.wait(0.1) and not slot.dead:
+                if time.monotonic() > deadline:
+                    self.close()
+                    raise TimeoutError(f"Worker {slot.index} not ready after {self._ready_timeout}s")
+        if all(slot.dead for slot in self._slots):
+            self.close()
+            raise RuntimeError("All orchestrator workers failed to start")
+        return self
+
+    def close(self) -> None:
+        self._closed = True
+        workers = [worker for slot in self._slots for worker in slot.workers()]
+        for worker in workers:
+            if worker.process.is_alive():
+                worker.requests.put(None)
+        for worker in workers:
+            worker.process.join(timeout=10)
+            if worker.process.is_alive():
+                worker.process.terminate()
+        if self._collector is not None:
+            self._collector.join(timeout=5)
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for entry in pending.values():
+            entry[0].set_exception(RuntimeError("Orchestrator pool closed"))
+
+    def __enter__(self) -> "OrchestratorPool":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # --------------------------------------------------------------------- #
+    # Response collection, recycling and crash recovery
+    # --------------------------------------------------------------------- #
+
+    def _collect(self) -> None:
+        while not self._closed:
+            conns = {
+                worker.conn: (slot, worker)
+                for slot in self._slots
+                for worker in slot.workers()
+                if worker.conn is not None
+            }
+            if not conns:
+                time.sleep(0.1)
+                continue
+            for conn in wait(list(conns), timeout=min(0.5, self._heartbeat_s)):
+                slot, worker = conns[conn]
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    self._on_exit(slot, worker)
+                    continue
+                self._on_message(slot, worker, message)
+            self._enforce_deadlines()
+        for slot in self._slots:
+            for worker in slot.workers():
+                if worker.conn is not None:
+                    worker.conn.close()
+
+    def _on_message(self, slot: _Slot, worker: _Worker, message: tuple) -> None:
+        kind = message[0]
+        if kind == "started":
+            worker.in_flight = (message[1], time.monotonic())
+        elif kind == "result":
+            _, req_id, ok, payload, _ = message
+            worker.in_flight = None
+            self._resolve(slot, worker, req_id, ok, payload)
+        elif kind == "heartbeat":
+            worker.heartbeat = time.monotonic()
+            worker.stats = message[1]
+        elif kind == "ready":
+            worker.heartbeat = time.monotonic()
+            slot.warm_s = message[2]
+            slot.start_failures = 0
+            worker.ready.set()
+            if worker is slot.standby:
+                self._promote(slot)
+        elif kind == "failed":
+            print(f"[orchestrator-pool] worker {slot.index} failed to start:\n{message[1]}")
+        elif kind == "recycle":
+            if worker is slot.worker and slot.standby is None and not self._closed:
+                slot.standby = self._spawn(slot)
+
+    def _promote(self, slot: _Slot) -> None:
+        """The warmed standby takes new requests; the old worker drains and exits."""
+        with self._lock:
+            old, slot.worker, slot.standby = slot.worker, slot.standby, None
+            old.requests.put(None)  # after everything already queued for it
+            slot.retiring.append(old)
+        slot.recycles += 1
+
+    def _enforce_deadlines(self) -> None:
+        """Terminate workers stuck on a request or in warm-up; EOF restarts them."""
+        now = time.monotonic()
+        for slot in self._slots:
+            for worker in slot.workers():
+                if worker.timed_out or not worker.process.is_alive():
+                    continue
+                if worker.in_flight and now - worker.in_flight[1] > self._request_timeout:
+                    reason = f"request exceeded {self._request_timeout}s"
+                elif not worker.ready.is_set() and now - worker.spawned > self._ready_timeout:
+                    reason = f"not ready after {self._ready_timeout}s"
+                else:
+                    continue
+                print(f"[orchestrator-pool] terminating worker {slot.index}: {reason}")
+                worker.timed_out = True
+                slot.timeouts += 1
+                worker.process.terminate()
+
+    def _resolve(self, slot: _Slot, worker: _Worker, req_id: str, ok: bool, payload: Any) -> None:
+        with self._lock:
+            entry = self._pending.pop(req_id, None)
+            try:
+                worker.outstanding.remove(req_id)
+            except ValueError:
+                pass
+        if entry is None:
+            return
+        future, kind, submitted, _ = entry
+        if kind != "query":  # prepares stay out of request metrics
+            if ok:
+                future.set_result(payload)
+            else:
+                future.set_exception(RuntimeError(payload))
+            return
+        slot.latencies.append(time.perf_counter() - submitted)
+        if ok:
+            slot.handled += 1
+            future.set_result(payload)
+        else:
+            slot.errors += 1
+            future.set_exception(RuntimeError(f"Worker {slot.index} failed:\n{payload}"))
+
+    def _fail(self, entries: List[tuple], error: str) -> None:
+        for entry in entries:
+            if entry is not None:
+                entry[0].set_exception(RuntimeError(error))
+
+    def _replay(self, req_ids: List[str], target: _Worker) -> None:
+        """Queue a dead worker's unstarted requests on `target` (caller holds the lock)."""
+        for req_id in req_ids:
+            entry = self._pending.get(req_id)
+            if entry is not None:
+                target.outstanding.append(req_id)
+                target.requests.put(entry[3])
+
+    def _take_outstanding(self, worker: _Worker) -> tuple[tuple | None, List[str]]:
+        """Split a dead worker's requests into the lost one and the rest (caller holds the lock).
+
+        The worker handles its queue in order, so only the request it had
+        picked up was lost; the others can be replayed.
+        """
+        lost = None
+        if worker.in_flight and worker.outstanding and worker.outstanding[0] == worker.in_flight[0]:
+            lost = self._pending.pop(worker.outstanding.popleft(), None)
+        queued = list(worker.outstanding)
+        worker.outstanding.clear()
+        return lost, queued
+
+    def _on_exit(self, slot: _Slot, worker: _Worker) -> None:
+        """A worker's pipe hit EOF: retire, restart or give up on the slot.
+
+        Requests can still be sent to the dead worker until the slot switches
+        over, so its outstanding list is handed off in the same critical
+        section that installs the replacement (or marks the slot dead).
+        """
+        worker.conn.close()
+        worker.conn = None
+        worker.process.join(timeout=10)
+        if self._closed:
+            return
+        final = worker.stats.pop("speculation", None)
+        if final:
+            slot.past_speculation = _merge_speculation([slot.past_speculation, {**final, "active": 0}])
+
+        stranded: List[tuple | None] = []
+        if worker is slot.standby:
+            # Never took requests; the old worker keeps serving meanwhile.
+            slot.standby = None
+            slot.start_failures += 1
+            if slot.start_failures < self._max_start_failures:
+                slot.restarts += 1
+                slot.standby = self._spawn(slot)
+            else:
+                print(f"[orchestrator-pool] worker {slot.index}: giving up on recycling, keeping the old process")
+            return
+
+        if worker in slot.retiring:
+            # Draining after a recycle: anything left goes to the current worker.
+            with self._lock:
+                slot.retiring.remove(worker)
+                lost, queued = self._take_outstanding(worker)
+                if slot.dead:
+                    stranded = [self._pending.pop(r, None) for r in queued]
+                else:
+                    self._replay(queued, slot.worker)
+        elif not worker.ready.is_set() and slot.start_failures + 1 >= self._max_start_failures:
+            # Give up on this slot: its keys move to the next worker on the ring.
+            slot.start_failures += 1
+            with self._lock:
+                slot.dead = True
+                lost, queued = self._take_outstanding(worker)
+                stranded = [self._pending.pop(r, None) for r in queued]
+            self._fail(stranded, f"Worker {slot.index} could not start")
+            stranded = []
+        else:
+            # Crashed (or failed to start): a recycle standby already warming
+            # up takes over, otherwise a fresh process. Spawn before taking
+            # the lock; the handoff below then also covers requests sent to
+            # the dead worker while the replacement was starting.
+            if not worker.ready.is_set():
+                slot.start_failures += 1
+            slot.restarts += 1
+            replacement = slot.standby or self._spawn(slot)
+            with self._lock:
+                slot.standby = None
+                slot.worker = replacement
+                lost, queued = self._take_outstanding(worker)
+                self._replay(queued, replacement)
+
+        if lost is not None:
+            slot.errors += lost[1] == "query"
+            if worker.timed_out:
+                error = f"Worker {slot.index} exceeded {self._request_timeout}s and was restarted"
+            else:
+                error = f"Worker {slot.index} exited with code {worker.process.exitcode}"
+            self._fail([lost], error)
+        self._fail(stranded, f"Worker {slot.index} is unavailable")
+
+    # --------------------------------------------------------------------- #
+    # Public API
+    # --------------------------------------------------------------------- #
+
+    def route(self, session_id: str, customer_id: str | None = None) -> int:
+        """Worker slot that serves this customer (or session, if no customer)."""
+        dead = {slot.index for slot in self._slots if slot.dead}
+        return self._ring.lookup(customer_id or f"session:{session_id}", exclude=dead)
+
+    def _send(self, slot: _Slot, kind: str, kwargs: dict | None) -> Future:
+        if self._closed:
+            raise RuntimeError("Orchestrator pool is closed")
+        future: Future = Future()
+        req_id = f"{os.getpid()}-{next(self._ids)}"
+        message = (kind, req_id, kwargs)
+        with self._lock:
+            if slot.dead:
+                raise _SlotDead(f"Worker {slot.index} is unavailable")
+            self._pending[req_id] = (future, kind, time.perf_counter(), message)
+            slot.worker.outstanding.append(req_id)
+            slot.worker.requests.put(message)
+        return future
+
+    def _send_routed(self, session_id: str, customer_id: str | None, kind: str, kwargs: dict) -> Future:
+        """Send to the routed slot; re-route if that slot dies before the send lands."""
+        while True:
+            index = self.route(session_id, customer_id)  # raises once no slot is left
+            self._follow_session(session_id, index)
+            try:
+                return self._send(self._slots[index], kind, kwargs)
+            except _SlotDead:
+                continue
+
+    def _follow_session(self, session_id: str, index: int | None) -> None:
+        """Move the session to slot `index`, invalidating its speculation elsewhere.
+
+        A worker only sees its own customers, so when a session switches to a
+        customer routed to another worker, the old worker is told to drop
+        what it precomputed (otherwise A -> B -> A would reuse stale work).
+        """
+        with self._lock:
+            previous = self._session_slots.pop(session_id, None)
+            if index is not None:
+                self._session_slots[session_id] = index
+        if previous is not None and previous != index:
+            try:
+                self._send(self._slots[previous], "prepare", {"session_id": session_id, "customer_id": None})
+            except _SlotDead:
+                pass  # its speculations died with it
+
+    def submit(self, session_id: str, query: str, customer_id: str | None = None) -> Future:
+        return self._send_routed(
+            session_id,
+            customer_id,
+            "query",
+            {"session_id": session_id, "query": query, "customer_id": customer_id},
+        )
+
+    def prepare(self, session_id: str, customer_id: str | None) -> None:
+        """Forward OrchestratorAgent.prepare to the customer's worker (fire and forget)."""
+        if customer_id is None:
+            self._follow_session(session_id, None)
+            return
+        self._send_routed(session_id, customer_id, "prepare", {"session_id": session_id, "customer_id": customer_id})
+
+    def handle_query(
+        self,
+        session_id: str,
+        query: str,
+        customer_id: str | None = None,
+        timeout: float | None = None,
+    ) -> dict:
+        return self.submit(session_id, query, customer_id).result(timeout)
+
+    def health(self) -> List[Dict[str, Any]]:
+        """Liveness of every slot's worker, without queueing behind its requests.
+
+        A worker is healthy while its process is alive, its heartbeat is
+        recent and its in-flight request (if any) is within `request_timeout`;
+        a long LLM call alone does not make it unhealthy.
+        """
+        now = time.monotonic()
+        report = []
+        for slot in self._slots:
+            worker = slot.worker
+            alive = worker is not None and worker.process.is_alive()
+            heartbeat_age = now - worker.heartbeat if worker else None
+            in_flight_s = now - worker.in_flight[1] if worker and worker.in_flight else None
+            healthy = (
+                alive
+                and not slot.dead
+                and worker.ready.is_set()
+                and heartbeat_age < 3 * self._heartbeat_s
+                and (in_flight_s is None or in_flight_s < self._request_timeout)
+            )
+            report.append({
+                "worker": slot.index,
+                "healthy": healthy,
+                "pid": worker.process.pid if worker else None,
+                "heartbeat_age_s": round(heartbeat_age, 3) if heartbeat_age is not None else None,
+                "in_flight_s": round(in_flight_s, 3) if in_flight_s is not None else None,
+                "outstanding": len(worker.outstanding) if worker else 0,
+                "warming_replacement": slot.standby is not None,
+                "speculation": worker.stats.get("speculation") if worker else None,
+            })
+        return report
+
+    def metrics(self) -> Dict[str, Any]:
+        """Aggregate and per-worker request counts, latency, lifecycle and speculation stats."""
+
+        def percentile(values: List[float], q: float) -> float | None:
+            if not values:
+                return None
+            values = sorted(values)
+            return values[min(len(values) - 1, int(q * len(values)))] * 1000
+
+        workers = []
+        all_latencies: List[float] = []
+        for slot in self._slots:
+            latencies = list(slot.latencies)
+            all_latencies += latencies
+            workers.append({
+                "worker": slot.index,
+                "pid": slot.worker.process.pid if slot.worker else None,
+                "alive": bool(slot.worker and slot.worker.process.is_alive()) and not slot.dead,
+                "handled": slot.handled,
+                "errors": slot.errors,
+                "outstanding": sum(len(w.outstanding) for w in slot.workers()),
+                "recycles": slot.recycles,
+                "restarts": slot.restarts,
+                "timeouts": slot.timeouts,
+                "warm_up_s": round(slot.warm_s, 3),
+                "p50_ms": percentile(latencies, 0.50),
+                "p95_ms": percentile(latencies, 0.95),
+                "speculation": slot.speculation(),
+            })
+        return {
+            "workers": len(self._slots),
+            "handled": sum(w["handled"] for w in workers),
+            "errors": sum(w["errors"] for w in workers),
+            "outstanding": sum(w["outstanding"] for w in workers),
+            "recycles": sum(w["recycles"] for w in workers),
+            "restarts": sum(w["restarts"] for w in workers),
+            "timeouts": sum(w["timeouts"] for w in workers),
+            "p50_ms": percentile(all_latencies, 0.50),
+            "p95_ms": percentile(all_latencies, 0.95),
+            "speculation": _merge_speculation([w["speculation"] for w in workers]),
+            "per_worker": workers,
+        }
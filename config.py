@@ -16,3 +16,28 @@ COHORT_AGENT_ID = os.getenv("COHORT_AGENT_ID", "find-cohort-agent")
 SUMMARIZATION_AGENT_ID = os.getenv("SUMMARIZATION_AGENT_ID", "summarization-agent")
 GCP_PROJECT_ID = os.getenv("GCP_PROJECT_ID", "my-project")
 GCP_LOCATION = os.getenv("GCP_LOCATION", "us-central1")
+
+# Customer picker: "graph" (Neo4j) or "csv" (seed files under data/)
+CUSTOMER_SOURCE = os.getenv("CUSTOMER_SOURCE", "graph")
+CUSTOMER_PAGE_SIZE = int(os.getenv("CUSTOMER_PAGE_SIZE", "25"))
+CUSTOMER_INDEX_TTL_S = float(os.getenv("CUSTOMER_INDEX_TTL_S", "300"))
+
+# Graph retrieval: "cypher" (TextToCypherAgent), "hybrid" (Graphiti search) or "both"
+GRAPH_RETRIEVAL = os.getenv("GRAPH_RETRIEVAL", "cypher")
+
+# Graphiti hybrid search; GRAPHITI_EMBEDDER="local" uses an offline stand-in embedder
+GRAPHITI_EMBEDDER = os.getenv("GRAPHITI_EMBEDDER", "openai")
+GRAPHITI_EMBEDDING_MODEL = os.getenv("GRAPHITI_EMBEDDING_MODEL", "text-embedding-3-small")
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "4096"))
+EMBEDDING_BATCH_WINDOW_MS = float(os.getenv("EMBEDDING_BATCH_WINDOW_MS", "5"))
+
+# Worker-pool deployment: 0 runs the orchestrator in-process
+ORCHESTRATOR_WORKERS = int(os.getenv("ORCHESTRATOR_WORKERS", "0"))
+WORKER_MAX_REQUESTS = int(os.getenv("WORKER_MAX_REQUESTS", "1000"))
+WORKER_MAX_REQUESTS_JITTER = int(os.getenv("WORKER_MAX_REQUESTS_JITTER", "100"))
+WORKER_REQUEST_TIMEOUT_S = float(os.getenv("WORKER_REQUEST_TIMEOUT_S", "300"))
+WORKER_HEARTBEAT_S = float(os.getenv("WORKER_HEARTBEAT_S", "2"))
+
+# Speculative precomputation (OrchestratorAgent.prepare)
+SPECULATION_WORKERS = int(os.getenv("SPECULATION_WORKERS", "4"))
+SPECULATION_MAX_AGE_S = float(os.getenv("SPECULATION_MAX_AGE_S", "300"))
@@ -0,0 +1,3 @@
+# Root conftest: lets pytest import `agents` from the repository root.
+# These are live scripts (Neo4j/OpenAI at import time), run them directly.
+collect_ignore = ["data/test_cipher.py", "test/test_orchestration.py"]
@@ -0,0 +1,36 @@
+import argparse
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from agents.graph.customer_source import fetch_customer_records, load_customer_records_csv
+from agents.sub_agents.graph_search_agent import GraphSearchAgent
+
+# Hybrid search (GRAPH_RETRIEVAL=hybrid|both) only sees facts Graphiti has
+# extracted from episodes; run this once after loading the graph, and again
+# for customers whose products or events change.
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingest customer records into Graphiti")
+    parser.add_argument("--csv", action="store_true", help="read the seed CSVs instead of Neo4j")
+    parser.add_argument("customer_ids", nargs="*", help="only these customers (default: all)")
+    args = parser.parse_args()
+
+    customer_ids = args.customer_ids or None
+    if args.csv:
+        records = load_customer_records_csv(customer_ids=customer_ids)
+    else:
+        records = fetch_customer_records(customer_ids=customer_ids)
+
+    graph_search_agent = GraphSearchAgent()
+    try:
+        print(f"Ingesting {len(records)} customers into Graphiti...")
+        count = graph_search_agent.ingest(records)
+        print(f"Added {count} episodes; indexed: {graph_search_agent.is_indexed()}")
+    finally:
+        graph_search_agent.close()
+
+
+if __name__ == "__main__":
+    main()
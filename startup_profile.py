@@ -0,0 +1,101 @@
+"""Report per-module import cost of the app entry points.
+
+Runs each module import in a fresh interpreter with ``-X importtime`` and
+prints the slowest modules and top-level packages, then fails if the cold
+import exceeds the budget.
+
+    python startup_profile.py
+    python startup_profile.py agents.orchestrator_agent --budget-ms 200 --top 25
+"""
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+DEFAULT_MODULES = ["agents.orchestrator_agent"]
+DEFAULT_BUDGET_MS = float(os.getenv("STARTUP_BUDGET_MS", "300"))
+
+# Measures wall time of the import itself, excluding interpreter start-up.
+_IMPORT_SNIPPET = (
+    "import time; t = time.perf_counter(); import {module}; "
+    "print(f'__wall_us__={{(time.perf_counter() - t) * 1e6:.0f}}')"
+)
+
+
+def profile_import(module: str) -> dict:
+    """Import `module` in a fresh interpreter and parse `-X importtime` output."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _IMPORT_SNIPPET.format(module=module)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr.strip().splitlines()[-1]}")
+
+    wall_us = 0
+    for line in proc.stdout.splitlines():
+        if line.startswith("__wall_us__="):
+            wall_us = int(line.split("=", 1)[1])
+
+    modules = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        modules.append(
+            {
+                "name": name.strip(),
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+            }
+        )
+    return {"module": module, "wall_us": wall_us, "modules": modules}
+
+
+def print_report(profile: dict, top: int) -> None:
+    modules = profile["modules"]
+    print(f"\n=== import {profile['module']}: {profile['wall_us'] / 1000:.1f} ms "
+          f"({len(modules)} modules) ===")
+
+    print(f"\n{'self ms':>9} {'cum ms':>9}  module")
+    for m in sorted(modules, key=lambda m: m["self_us"], reverse=True)[:top]:
+        print(f"{m['self_us'] / 1000:9.1f} {m['cumulative_us'] / 1000:9.1f}  {m['name']}")
+
+    by_package = defaultdict(int)
+    for m in modules:
+        by_package[m["name"].split(".", 1)[0]] += m["self_us"]
+    print(f"\n{'self ms':>9}  top-level package")
+    for name, self_us in sorted(by_package.items(), key=lambda kv: kv[1], reverse=True)[:top]:
+        print(f"{self_us / 1000:9.1f}  {name}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="fail if any cold import takes longer (env STARTUP_BUDGET_MS)")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    over_budget = []
+    for module in args.modules:
+        profile = profile_import(module)
+        print_report(profile, args.top)
+        if profile["wall_us"] / 1000 > args.budget_ms:
+            over_budget.append(module)
+
+    print()
+    if over_budget:
+        print(f"FAIL: over {args.budget_ms:.0f} ms budget: {', '.join(over_budget)}")
+        return 1
+    print(f"OK: all imports within {args.budget_ms:.0f} ms budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
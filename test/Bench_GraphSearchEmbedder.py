@@ -0,0 +1,27 @@
+import asyncio
+import time
+
+from agents.sub_agents.graphiti_embedders import build_embedder
+
+# Offline benchmark of the hybrid-search embedding path (cache + batching)
+# using the local stand-in embedder; no Neo4j or OpenAI access needed.
+QUERIES = [
+    f"What products does customer CUST{i % 100:04d} has with us"
+    for i in range(2000)
+]
+
+
+async def run(embedder, concurrency: int) -> float:
+    start = time.perf_counter()
+    for i in range(0, len(QUERIES), concurrency):
+        chunk = QUERIES[i:i + concurrency]
+        await asyncio.gather(*(embedder.create([q]) for q in chunk))
+    return time.perf_counter() - start
+
+
+for concurrency in (1, 16, 64):
+    embedder = build_embedder("local", batch_window_ms=2)
+    elapsed = asyncio.run(run(embedder, concurrency))
+    print(f"------------ concurrency {concurrency} ----------------")
+    print(f"{len(QUERIES) / elapsed:,.0f} queries/s")
+    print(embedder.stats())
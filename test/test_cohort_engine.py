@@ -0,0 +1,114 @@
+import numpy as np
+
+from agents.graph.customer_source import load_customer_records_csv
+from agents.sub_agents.cohort_engine import DEMOGRAPHIC_PREFIXES, CohortEngine
+
+# Offline: the engine is fed from the seed CSVs, no Neo4j needed.
+RECORDS = load_customer_records_csv()
+
+
+def make_engine(records=None, **kwargs):
+    store = {r["customer"]["customerId"]: r for r in (records or RECORDS)}
+
+    def loader(customer_ids):
+        if customer_ids is None:
+            return list(store.values())
+        return [store[cid] for cid in customer_ids if cid in store]
+
+    return CohortEngine(loader=loader, seed=0, **kwargs), store
+
+
+def test_build_indexes_every_customer():
+    engine, _ = make_engine()
+    engine.build()
+    assert engine.is_built
+    result = engine.find_cohorts(RECORDS[0]["customer"]["customerId"])
+    assert result["cohort"]["size"] >= 1
+    assert result["cohorts"] == [result["cohort"]["label"]]
+    assert 0 < len(result["similar_customers"]) <= 10
+    assert all(s["customer_id"] != result["customer_id"] for s in result["similar_customers"])
+
+
+def test_find_cohorts_unknown_customer():
+    engine, _ = make_engine()
+    result = engine.find_cohorts("CUST_DOES_NOT_EXIST")
+    assert result["cohort"] is None
+    assert result["similar_customers"] == []
+
+
+def test_open_events_match_csv():
+    engine, _ = make_engine()
+    for record in RECORDS:
+        expected = {
+            e["EventID"] for e in record["events"]
+            if str(e.get("event_status", "")).lower() == "open"
+        }
+        found = engine.find_cohorts(record["customer"]["customerId"])["open_events"]
+        assert {e["eventId"] for e in found} == expected
+
+
+def test_refresh_matches_full_neighbour_rebuild():
+    engine, store = make_engine()
+    engine.build()
+    changed = [r["customer"]["customerId"] for r in RECORDS[1:4]]
+    for cid in changed:
+        store[cid] = dict(store[cid], events=[])
+    engine.refresh(changed)
+    incremental = engine._nn_sim.copy()
+
+    engine._rebuild_neighbors()
+    np.testing.assert_allclose(incremental, engine._nn_sim, atol=1e-5)
+    assert all(engine.find_cohorts(cid)["open_events"] == [] for cid in changed)
+
+
+def test_refresh_new_customer_matches_full_neighbour_rebuild():
+    engine, store = make_engine()
+    engine.build()
+    template = RECORDS[5]
+    new = {**template, "customer": {**template["customer"], "customerId": "CUST9999"}}
+    store["CUST9999"] = new
+    engine.refresh(["CUST9999"])
+    assert len(engine._ids) == len(RECORDS) + 1
+    incremental = engine._nn_sim.copy()
+
+    engine._rebuild_neighbors()
+    np.testing.assert_allclose(incremental, engine._nn_sim, atol=1e-5)
+    similar = engine.find_cohorts("CUST9999")["similar_customers"]
+    assert similar[0]["customer_id"] == template["customer"]["customerId"]
+
+
+def test_refresh_removed_customer_twice():
+    engine, store = make_engine()
+    engine.build()
+    cid = RECORDS[-1]["customer"]["customerId"]
+    del store[cid]
+    engine.refresh([cid])
+    engine.refresh([cid])  # nothing fetched, nothing removed: must be a no-op
+    engine.refresh(["CUST_DOES_NOT_EXIST"])
+    assert engine.find_cohorts(cid)["cohort"] is None
+    assert len(engine._ids) == len(RECORDS) - 1
+
+
+def test_refresh_new_customer():
+    engine, store = make_engine(RECORDS[:-1])
+    engine.build()
+    new = RECORDS[-1]
+    store[new["customer"]["customerId"]] = new
+    engine.refresh([new["customer"]["customerId"]])
+    result = engine.find_cohorts(new["customer"]["customerId"])
+    assert result["cohort"] is not None
+    assert np.isfinite(engine._matrix).all()
+
+
+def test_labels_leave_out_demographics_by_default():
+    engine, _ = make_engine()
+    engine.build()
+    texts = engine._cluster_names + [p for profile in engine._cluster_profiles for p in profile]
+    for text in texts:
+        assert not any(text.endswith(f" {prefix}") for prefix in DEMOGRAPHIC_PREFIXES)
+
+
+def test_labels_can_include_demographics():
+    engine, _ = make_engine(describe_demographics=True, n_clusters=8)
+    engine.build()
+    assert len(engine._cluster_names) == 8
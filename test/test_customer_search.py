@@ -0,0 +1,69 @@
+import time
+
+from agents.graph.customer_search import CustomerSearchIndex
+
+
+def ids(page):
+    return [item["customer_id"] for item in page["items"]]
+
+
+def test_merge_keeps_renames_and_removals_consistent():
+    index = CustomerSearchIndex(merge_threshold=16)
+    index.add({"customer_id": f"CUST{i:04d}", "name": f"Person {i}"} for i in range(100))
+    index.add([{"customer_id": "CUST0007", "name": "Samantha Davis"}])
+    index.remove("CUST0008")
+    index.add({"customer_id": f"CUST{i:04d}", "name": f"Renamed {i}"} for i in range(10, 16))
+    # Enough adds to trigger several merges, with stale rows carried across.
+    for start in range(100, 200, 10):
+        index.add(
+            {"customer_id": f"CUST{i:04d}", "name": f"Person {i}"} for i in range(start, start + 10)
+        )
+
+    assert len(index) == 199
+    assert ids(index.search("samantha")) == ["CUST0007"]
+    assert ids(index.search("person 7")) != [] and "CUST0007" not in ids(index.search("person 7", 50))
+    assert ids(index.search("cust0008")) == []
+    assert ids(index.search("cust0199")) == ["CUST0199"]
+    assert index.get("CUST0008") is None
+    assert ids(index.search("renamed", 50)) == [f"CUST{i:04d}" for i in range(10, 16)]
+    assert not {f"CUST{i:04d}" for i in range(10, 16)} & set(ids(index.search("person 1", 200)))
+    assert not index._stale and not index._merging
+
+
+def test_search_pages():
+    index = CustomerSearchIndex(
+        {"customer_id": f"CUST{i:04d}", "name": "Ann Lee"} for i in range(30)
+    )
+    first = index.search("ann", limit=25)
+    second = index.search("ann", limit=25, offset=first["next_offset"])
+    assert len(first["items"]) == 25 and first["next_offset"] == 25
+    assert len(second["items"]) == 5 and second["next_offset"] is None
+    assert not set(ids(first)) & set(ids(second))
+
+
+def test_refresh_picks_up_new_renamed_and_removed_customers():
+    source = [{"customer_id": f"CUST{i:04d}", "name": f"Person {i}"} for i in range(10)]
+    index = CustomerSearchIndex(list(source), loader=lambda: list(source))
+    assert index.refresh() == {"added": 0, "updated": 0, "removed": 0}
+
+    source.append({"customer_id": "CUST0100", "name": "Grace Hopper"})
+    source[1] = {"customer_id": "CUST0001", "name": "Ada Lovelace"}
+    del source[2]
+    assert index.refresh() == {"added": 1, "updated": 1, "removed": 1}
+    assert ids(index.search("hopper")) == ["CUST0100"]
+    assert ids(index.search("lovelace")) == ["CUST0001"]
+    assert index.get("CUST0002") is None
+    assert len(index) == 10
+
+
+def test_refresh_if_stale_runs_in_background():
+    source = [{"customer_id": "CUST0001", "name": "Ann Lee"}]
+    index = CustomerSearchIndex(list(source), loader=lambda: list(source))
+    source.append({"customer_id": "CUST0002", "name": "Bob Stone"})
+    assert not index.refresh_if_stale(max_age_s=3600)
+    assert index.refresh_if_stale(max_age_s=0.000001)
+    for _ in range(100):
+        if index.get("CUST0002"):
+            break
+        time.sleep(0.01)
+    assert index.get("CUST0002") == {"customer_id": "CUST0002", "name": "Bob Stone"}
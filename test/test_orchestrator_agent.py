@@ -0,0 +1,129 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import agents.orchestrator_agent as orchestrator_module
+from agents.orchestrator_agent import OrchestratorAgent
+
+# Offline: stub sub-agents with fixed latencies exercise prepare/handle_query.
+
+
+class StubClient:
+    def run_query(self, query, params=None):
+        time.sleep(0.05)
+        return [{"eventId": "E1"}]
+
+
+class StubMemory:
+    def __init__(self, delay: float = 0.05) -> None:
+        self.client = StubClient()
+        self.delay = delay
+        self.turns = []
+        self.lock = threading.Lock()
+
+    def append_turn(self, session_id, role, text, customer_id=None):
+        with self.lock:
+            self.turns.append({"session_id": session_id, "role": role, "text": text})
+
+    def get_recent_context(self, session_id, limit=10):
+        time.sleep(self.delay)
+        with self.lock:
+            turns = [t for t in self.turns if t["session_id"] == session_id]
+        return [{"role": t["role"], "text": t["text"]} for t in reversed(turns)][:limit]
+
+
+class StubCohorts:
+    def find_cohorts(self, query, customer_id=None):
+        time.sleep(0.05)
+        return {"customer_id": customer_id, "cohorts": [f"cohort of {customer_id}"]}
+
+
+class StubTextToCypher:
+    def query(self, nl_query):
+        time.sleep(0.05)
+        return {"answer": "", "cypher": "", "rows": []}
+
+
+class StubSummarizer:
+    def summarize(self, **kwargs):
+        self.last = kwargs
+        return "Final Response: ok"
+
+
+def make_agent(memory_delay: float = 0.05) -> OrchestratorAgent:
+    return OrchestratorAgent(
+        memory_store=StubMemory(memory_delay),
+        text_to_cypher_agent=StubTextToCypher(),
+        cohort_agent=StubCohorts(),
+        summarizer=StubSummarizer(),
+        retrieval="cypher",
+    )
+
+
+def stage_counts(agent, key):
+    return {stage: s[key] for stage, s in agent.speculation_metrics()["stages"].items()}
+
+
+def user_turns(agent, query):
+    context = agent.summarizer.last["conversation_context"]
+    return [t for t in context if t["role"] == "user" and t["text"] == query]
+
+
+def test_finished_speculation_is_a_hit():
+    agent = make_agent(memory_delay=0.2)
+    agent.prepare("s", "CUST0001")
+    time.sleep(0.3)
+    result = agent.handle_query("s", "q1", "CUST0001")
+    assert result["cohort"]["cohorts"] == ["cohort of CUST0001"]
+    assert stage_counts(agent, "hits") == {"cohort": 1, "context": 1, "open_events": 1}
+    assert len(user_turns(agent, "q1")) == 1
+    metrics = agent.speculation_metrics()
+    # Only the wait past retrieval (0.05 s) counts, and stages overlap: about
+    # 150 ms for the 0.2 s context read, not the 300 ms sum of stage durations.
+    assert 100 < metrics["time_saved_ms"] < 200
+    assert metrics["queries"] == 1
+
+
+def test_in_flight_speculation_is_picked_up():
+    agent = make_agent(memory_delay=0.3)
+    agent.prepare("s", "CUST0001")
+    agent.handle_query("s", "q1", "CUST0001")
+    assert stage_counts(agent, "in_flight")["context"] == 1
+    assert stage_counts(agent, "misses") == {"cohort": 0, "context": 0, "open_events": 0}
+
+
+def test_customer_change_invalidates_speculation():
+    agent = make_agent()
+    agent.prepare("s", "CUST0001")
+    agent.prepare("s", "CUST0001")  # same customer: kept
+    agent.prepare("s", "CUST0002")
+    assert stage_counts(agent, "invalidated") == {"cohort": 1, "context": 1, "open_events": 1}
+
+    result = agent.handle_query("s", "q1", "CUST0003")
+    assert result["cohort"]["cohorts"] == ["cohort of CUST0003"]
+    assert stage_counts(agent, "invalidated")["cohort"] == 2
+    assert stage_counts(agent, "misses")["cohort"] == 1
+
+
+def test_expired_speculations_are_evicted(monkeypatch):
+    monkeypatch.setattr(orchestrator_module, "SPECULATION_MAX_AGE_S", 0.1)
+    agent = make_agent()
+    for session_id in ("s1", "s2", "s3"):
+        agent.prepare(session_id, "CUST0001")
+    time.sleep(0.2)
+    agent.prepare("s4", "CUST0002")
+    metrics = agent.speculation_metrics()
+    assert metrics["evicted"] == 3 and metrics["active"] == 1
+
+
+def test_backlogged_speculative_context_does_not_duplicate_the_question():
+    agent = make_agent()
+    agent.handle_query("s", "q1", "CUST0001")
+    # One busy executor thread: the speculative context read has not started
+    # yet when the question arrives.
+    agent._executor = ThreadPoolExecutor(max_workers=1)
+    agent.executor.submit(time.sleep, 0.2)
+    agent.prepare("s", "CUST0002")
+    agent.handle_query("s", "q2", "CUST0002")
+    assert len(user_turns(agent, "q2")) == 1
+    assert user_turns(agent, "q1")
@@ -0,0 +1,149 @@
+import functools
+import os
+import threading
+import time
+
+import pytest
+
+from agents.worker_pool import OrchestratorPool
+
+# Offline: workers run a stub agent instead of a full OrchestratorAgent.
+# The factory must be picklable, since workers are started with "spawn".
+
+
+class StubAgent:
+    def __init__(self, warm_s: float) -> None:
+        self.warm_s = warm_s
+
+    def warm_up(self) -> None:
+        time.sleep(self.warm_s)
+
+    def prepare(self, session_id, customer_id):
+        return None
+
+    def handle_query(self, session_id, query, customer_id=None):
+        if query == "crash":
+            os._exit(3)
+        if query == "hang":
+            time.sleep(3600)
+        if query.startswith("sleep "):
+            time.sleep(float(query.split()[1]))
+        return {"answer": query, "pid": os.getpid()}
+
+
+class BrokenAgent:
+    def warm_up(self) -> None:
+        raise RuntimeError("no neo4j")
+
+
+def stub_factory(warm_s: float = 0.0) -> StubAgent:
+    return StubAgent(warm_s)
+
+
+def broken_factory() -> BrokenAgent:
+    return BrokenAgent()
+
+
+def make_pool(**kwargs) -> OrchestratorPool:
+    options = dict(
+        workers=2,
+        max_requests=0,
+        max_requests_jitter=0,
+        agent_factory=stub_factory,
+        heartbeat_s=0.1,
+        ready_timeout=30,
+    )
+    options.update(kwargs)
+    return OrchestratorPool(**options)
+
+
+def customer_on(pool: OrchestratorPool, index: int) -> str:
+    return next(f"CUST{i:04d}" for i in range(1000) if pool.route("s", f"CUST{i:04d}") == index)
+
+
+def test_routing_is_stable_per_customer():
+    with make_pool(workers=3) as pool:
+        pids = {}
+        for i in range(30):
+            customer_id = f"CUST{i % 6:04d}"
+            result = pool.handle_query("s", "q", customer_id, timeout=10)
+            pids.setdefault(customer_id, set()).add(result["pid"])
+        assert all(len(p) == 1 for p in pids.values())
+        assert len({pid for p in pids.values() for pid in p}) > 1
+        assert pool.route("other-session", "CUST0001") == pool.route("s", "CUST0001")
+        assert all(h["healthy"] for h in pool.health())
+
+
+def test_crash_fails_in_flight_request_and_replays_the_rest():
+    with make_pool() as pool:
+        futures = [pool.submit("s", "crash", "CUST0001")]
+        futures += [pool.submit("s", f"q{i}", "CUST0001") for i in range(3)]
+        with pytest.raises(RuntimeError, match="exited with code 3"):
+            futures[0].result(10)
+        assert [f.result(10)["answer"] for f in futures[1:]] == ["q0", "q1", "q2"]
+        assert pool.metrics()["restarts"] == 1
+
+
+def test_requests_sent_during_restart_are_not_lost():
+    with make_pool() as pool:
+        customer_id = customer_on(pool, 0)
+        for _ in range(3):
+            futures, stop = [], threading.Event()
+
+            def flood():
+                while not stop.is_set():
+                    futures.append(pool.submit("s", "q", customer_id))
+                    time.sleep(0.001)
+
+            sender = threading.Thread(target=flood)
+            sender.start()
+            time.sleep(0.05)
+            crashed = pool.submit("s", "crash", customer_id)
+            time.sleep(0.3)
+            stop.set()
+            sender.join()
+            with pytest.raises(RuntimeError):
+                crashed.result(10)
+            # Every request resolves; none is stranded on the dead worker's queue.
+            assert all(f.result(10)["answer"] == "q" for f in futures)
+
+
+def test_recycle_warms_standby_before_retiring():
+    factory = functools.partial(stub_factory, warm_s=0.5)
+    with make_pool(workers=1, max_requests=3, agent_factory=factory) as pool:
+        pids, worst = set(), 0.0
+        for i in range(15):
+            started = time.perf_counter()
+            pids.add(pool.handle_query("s", f"q{i}", "CUST0001", timeout=10)["pid"])
+            worst = max(worst, time.perf_counter() - started)
+            time.sleep(0.1)
+        metrics = pool.metrics()
+        assert metrics["recycles"] >= 1 and len(pids) >= 2
+        assert worst < 0.4  # nobody waited through the 0.5 s warm-up
+        assert metrics["errors"] == 0 and metrics["restarts"] == 0
+
+
+def test_busy_worker_stays_healthy():
+    with make_pool(workers=1, request_timeout=10) as pool:
+        future = pool.submit("s", "sleep 1", "CUST0001")
+        time.sleep(0.5)
+        (status,) = pool.health()
+        assert status["healthy"] and status["in_flight_s"] > 0.3
+        future.result(10)
+
+
+def test_hung_request_is_terminated_and_queue_replayed():
+    with make_pool(workers=1, request_timeout=1.0) as pool:
+        hung = pool.submit("s", "hang", "CUST0001")
+        queued = pool.submit("s", "after", "CUST0001")
+        with pytest.raises(RuntimeError, match="exceeded"):
+            hung.result(10)
+        assert queued.result(10)["answer"] == "after"
+        assert pool.metrics()["timeouts"] == 1
+        time.sleep(0.3)
+        assert pool.health()[0]["healthy"]
+
+
+def test_pool_refuses_to_start_without_a_working_worker():
+    with pytest.raises(RuntimeError, match="failed to start"):
+        make_pool(workers=1, agent_factory=broken_factory).start()
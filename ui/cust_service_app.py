@@ -1,11 +1,13 @@
 import streamlit as st
 import uuid
-import json
 import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from agents.orchestrator_agent import OrchestratorAgent
+from agents.graph.customer_search import CustomerSearchIndex
+from agents.worker_pool import OrchestratorPool
+from config import CUSTOMER_SOURCE, CUSTOMER_PAGE_SIZE, CUSTOMER_INDEX_TTL_S, ORCHESTRATOR_WORKERS
 
 st.set_page_config(page_title="Customer Service Agentic App", page_icon="🤖")
 
@@ -18,7 +20,23 @@ if "session_id" not in st.session_state:
 if "chat_history" not in st.session_state:
     st.session_state.chat_history = []
 
-orchestrator = OrchestratorAgent()
+# Built once per server process (not on every script rerun); sub-agents and
+# their SDKs load lazily on the first question. With ORCHESTRATOR_WORKERS > 0
+# requests go to a pool of warmed worker processes, routed by customer.
+@st.cache_resource
+def get_orchestrator() -> OrchestratorAgent | OrchestratorPool:
+    if ORCHESTRATOR_WORKERS > 0:
+        return OrchestratorPool(workers=ORCHESTRATOR_WORKERS).start()
+    return OrchestratorAgent()
+
+orchestrator = get_orchestrator()
+
+if isinstance(orchestrator, OrchestratorPool):
+    with st.sidebar.expander("Worker pool"):
+        st.json(orchestrator.metrics())
+else:
+    with st.sidebar.expander("Speculative precompute"):
+        st.json(orchestrator.speculation_metrics())
 
 st.title("Customer Service Agentic Application")
 
@@ -29,21 +47,43 @@ st.markdown(
 )
 
 # -------------------------------------------------------------------
-# Load customers and set up dropdown
+# Customer lookup: server-side typeahead, only one page reaches the browser
 # -------------------------------------------------------------------
-@st.cache_data
-def load_customers(path: str | None = None):
-    if path is None:
-        path = Path(__file__).parent / "customers.json"
-    else:
-        path = Path(path)
-    with open(path, "r") as f:
-        return json.load(f)
+@st.cache_resource
+def get_customer_index() -> CustomerSearchIndex:
+    if CUSTOMER_SOURCE == "csv":
+        return CustomerSearchIndex.from_csv()
+    return CustomerSearchIndex.from_graph()
+
+customer_index = get_customer_index()
+# Pick up customers added, renamed or removed since start-up (background refresh)
+customer_index.refresh_if_stale(CUSTOMER_INDEX_TTL_S)
+
+customer_query = st.text_input(
+    "Find customer",
+    placeholder="Customer id or name, e.g. CUST0007 or Davis",
+)
+
+# Matches are paged: a new query starts over, "Show more" appends the next page.
+if st.session_state.get("customer_query") != customer_query:
+    first_page = customer_index.search(customer_query, limit=CUSTOMER_PAGE_SIZE)
+    st.session_state.customer_query = customer_query
+    st.session_state.customer_matches = first_page["items"]
+    st.session_state.customer_next_offset = first_page["next_offset"]
+
+
+def load_more_customers() -> None:
+    page = customer_index.search(
+        st.session_state.customer_query,
+        limit=CUSTOMER_PAGE_SIZE,
+        offset=st.session_state.customer_next_offset,
+    )
+    st.session_state.customer_matches += page["items"]
+    st.session_state.customer_next_offset = page["next_offset"]
 
-customers = load_customers()
 
 # Build options list with a "no customer" option
-customer_options = [None] + customers
+customer_options = [None] + st.session_state.customer_matches
 
 selected_customer = st.selectbox(
     "Customer (Required)",
@@ -55,12 +95,24 @@ selected_customer = st.selectbox(
     ),
     help="Select a customer to link memory and cohort lookups. You can also leave this empty.",
 )
+shown = len(st.session_state.customer_matches)
+if st.session_state.customer_next_offset is not None:
+    st.caption(
+        f"Showing the first {shown} matching customers; more match. "
+        "Type more of the id or name to narrow it down."
+    )
+    st.button("Show more customers", on_click=load_more_customers)
+elif customer_query:
+    st.caption(f"{shown} matching customer{'s' if shown != 1 else ''}.")
 
 # This is what we pass into the orchestrator
 selected_customer_id = (
     selected_customer["customer_id"] if selected_customer is not None else None
 )
 
+# Start cohort / context / open-event lookups while the rep types the question
+orchestrator.prepare(st.session_state.session_id, selected_customer_id)
+
 # -------------------------------------------------------------------
 # Display existing chat
 # -------------------------------------------------------------------